@@ -1,10 +1,13 @@
-from collections.abc import Callable
+import functools
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
 
 import pygame
 
 from .cell import Cell
 from .cell_change_info import CellChangeInfo, CellChanges
 from .cell_group import CellGroup
+from .cell_state import CellState
 from .color import Color
 from .direction import Direction
 from .garden import Garden
@@ -20,6 +23,27 @@ class AdjacentCluesError(Exception):
     pass
 
 
+ResultT = TypeVar('ResultT')
+
+
+def versioned_cache(method: Callable[['Board'], ResultT]) -> Callable[['Board'], ResultT]:
+    """
+    Cache the result of a Board method until the board's version changes, which happens on every cell state change.
+    The same result is handed to every caller, so the decorated method should return an immutable value.
+    """
+    cache_attribute_name = f'_{method.__name__}_cache'
+
+    @functools.wraps(method)
+    def get_cached_result(board: 'Board') -> ResultT:
+        cache: tuple[int, ResultT] | None = getattr(board, cache_attribute_name, None)
+        if cache is None or cache[0] != board.version:
+            cache = (board.version, method(board))
+            setattr(board, cache_attribute_name, cache)
+        return cache[1]
+
+    return get_cached_result
+
+
 class Board:
     def __init__(self, level: Level, screen: Screen):
         self.level = level
@@ -30,6 +54,11 @@ class Board:
         self.cell_grid = self.create_cell_grid()
         self.flat_cell_list = self.get_flat_cell_list()
         self.set_cell_neighbors()
+        self.adjacent_flat_indexes = self.get_adjacent_flat_indexes()
+        self.state_bits = self.create_state_bits()
+        self.cells_by_state = self.create_cells_by_state()
+        self.version = 0  # incremented on every cell state change to invalidate cached results
+        self.set_cell_state_change_callbacks()
         self.is_board_frozen = False
 
         self.ensure_no_adjacent_clues()
@@ -60,7 +89,8 @@ class Board:
 
     def create_cell(self, row_number: int, col_number: int, cell_clue: int | None) -> Cell:
         cell_pixel_position = self.screen.get_cell_location(self.rect, row_number, col_number)
-        return Cell(row_number, col_number, cell_clue, cell_pixel_position, self.screen)
+        flat_index = row_number * self.level.number_of_columns + col_number
+        return Cell(row_number, col_number, flat_index, cell_clue, cell_pixel_position, self.screen)
 
     def get_flat_cell_list(self) -> list[Cell]:
         """Get a one dimensional list of cells. This is useful for easier looping."""
@@ -89,6 +119,156 @@ class Board:
             neighbor_cell = None
         return neighbor_cell
 
+    def get_adjacent_flat_indexes(self) -> list[tuple[int, ...]]:
+        """
+        For each cell, indexed by its position in flat_cell_list, get the flat indexes of its adjacent (non-diagonal)
+        neighbors. Searches that keep their state in flat lists can use this to walk the board without Cell objects.
+        """
+        return [
+            tuple(neighbor_cell.flat_index for neighbor_cell in cell.get_adjacent_neighbors())
+            for cell in self.flat_cell_list
+        ]
+
+    def create_state_bits(self) -> dict[CellState, list[int]]:
+        """
+        For each cell state, create a list with one bitmask per row. Bit i of a row's bitmask is set if the cell in
+        column i of that row is in the given cell state. This allows checks that span many cells to be done with a few
+        integer operations per row.
+        """
+        state_bits = {cell_state: [0] * self.level.number_of_rows for cell_state in CellState}
+        for cell in self.flat_cell_list:
+            state_bits[cell.cell_state][cell.row_number] |= 1 << cell.col_number
+        return state_bits
+
+    def create_cells_by_state(self) -> dict[CellState, set[Cell]]:
+        """
+        For each cell state, create the set of cells in that state. Like the state bitmasks, these are kept in sync as
+        cell states change so that getting the cells in a state doesn't require looking at every cell.
+        """
+        cells_by_state: dict[CellState, set[Cell]] = {cell_state: set() for cell_state in CellState}
+        for cell in self.flat_cell_list:
+            cells_by_state[cell.cell_state].add(cell)
+        return cells_by_state
+
+    def set_cell_state_change_callbacks(self) -> None:
+        for cell in self.flat_cell_list:
+            cell.set_state_change_callback(self.handle_cell_state_change)
+
+    def handle_cell_state_change(self, cell: Cell, old_cell_state: CellState) -> None:
+        """Keep the state bitmasks and sets in sync with the cell states and invalidate any cached results."""
+        self.version += 1
+        cell_bit = 1 << cell.col_number
+        self.state_bits[old_cell_state][cell.row_number] &= ~cell_bit
+        self.state_bits[cell.cell_state][cell.row_number] |= cell_bit
+        self.cells_by_state[old_cell_state].discard(cell)
+        self.cells_by_state[cell.cell_state].add(cell)
+
+    def get_cells_from_row_bits(self, row_number: int, row_bits: int) -> Iterator[Cell]:
+        """Get the cells, from left to right, in the given row whose column's bit is set in row_bits."""
+        row = self.cell_grid[row_number]
+        while row_bits:
+            lowest_set_bit = row_bits & -row_bits
+            yield row[lowest_set_bit.bit_length() - 1]
+            row_bits ^= lowest_set_bit
+
+    def get_cells_from_all_row_bits(self, row_bits: list[int]) -> Iterator[Cell]:
+        """Get the cells, row by row from top to bottom, whose column's bit is set in their row's bitmask."""
+        for row_number, bits in enumerate(row_bits):
+            yield from self.get_cells_from_row_bits(row_number, bits)
+
+    def get_row_bits(self, cells: Iterable[Cell]) -> list[int]:
+        """Get one bitmask per row with the bits set for the columns of the given cells in that row."""
+        row_bits = [0] * self.level.number_of_rows
+        for cell in cells:
+            row_bits[cell.row_number] |= 1 << cell.col_number
+        return row_bits
+
+    def get_adjacent_row_bits(self, row_bits: list[int]) -> list[int]:
+        """
+        Get the row bitmasks of the cells that are adjacent (non-diagonally) to the cells in the given row bitmasks,
+        excluding those cells themselves.
+        """
+        full_row_bits = (1 << self.level.number_of_columns) - 1
+        last_row_number = self.level.number_of_rows - 1
+        adjacent_row_bits = []
+        for row_number, bits in enumerate(row_bits):
+            adjacent_bits = (bits << 1) | (bits >> 1)
+            if row_number > 0:
+                adjacent_bits |= row_bits[row_number - 1]
+            if row_number < last_row_number:
+                adjacent_bits |= row_bits[row_number + 1]
+            adjacent_row_bits.append(adjacent_bits & full_row_bits & ~bits)
+        return adjacent_row_bits
+
+    def get_row_bits_within_distance(self, cell: Cell, distance: int) -> list[int]:
+        """
+        Get the row bitmasks of the cells within the given Manhattan distance of the cell, including the cell itself.
+        These cells form a diamond, so each row is a single run of bits centered on the cell's column.
+        """
+        row_bits = [0] * self.level.number_of_rows
+        first_row_number = max(cell.row_number - distance, 0)
+        last_row_number = min(cell.row_number + distance, self.level.number_of_rows - 1)
+        for row_number in range(first_row_number, last_row_number + 1):
+            half_width = distance - abs(row_number - cell.row_number)
+            first_col_number = max(cell.col_number - half_width, 0)
+            last_col_number = min(cell.col_number + half_width, self.level.number_of_columns - 1)
+            row_bits[row_number] = ((1 << (last_col_number - first_col_number + 1)) - 1) << first_col_number
+        return row_bits
+
+    def get_expanded_row_bits(self, row_bits: list[int], distance: int) -> list[int]:
+        """
+        Get the row bitmasks of the cells within the given Manhattan distance of the cells in the given row bitmasks,
+        including those cells. Each step adds the adjacent cells of everything found so far, and there are no obstacles,
+        so after distance steps this is exactly the cells within that Manhattan distance.
+        """
+        expanded_row_bits = list(row_bits)
+        for _ in range(distance):
+            adjacent_row_bits = self.get_adjacent_row_bits(expanded_row_bits)
+            if not any(adjacent_row_bits):
+                break
+            expanded_row_bits = [
+                expanded_bits | adjacent_bits
+                for expanded_bits, adjacent_bits in zip(expanded_row_bits, adjacent_row_bits, strict=True)
+            ]
+        return expanded_row_bits
+
+    def get_empty_adjacent_cells(self, cells: Iterable[Cell]) -> set[Cell]:
+        """
+        Get the empty cells that are adjacent (non-diagonally) to the given cells. The cells are dilated as row bitmasks
+        rather than by looking at the neighbors of each cell one at a time.
+        """
+        adjacent_row_bits = self.get_adjacent_row_bits(self.get_row_bits(cells))
+        empty_row_bits = self.state_bits[CellState.EMPTY]
+        return set(
+            self.get_cells_from_all_row_bits(
+                [
+                    adjacent_bits & empty_bits
+                    for adjacent_bits, empty_bits in zip(adjacent_row_bits, empty_row_bits, strict=True)
+                ]
+            )
+        )
+
+    def get_connected_row_bits(self, seed_row_bits: list[int], allowed_row_bits: list[int]) -> list[int]:
+        """
+        Get the row bitmasks of the cells that are connected (non-diagonally) to the seed cells through cells in the
+        allowed row bitmasks. Seed cells that are not allowed are not included. Each step of the flood fill expands the
+        whole frontier at once with a few integer operations per row.
+        """
+        connected_row_bits = [seed & allowed for seed, allowed in zip(seed_row_bits, allowed_row_bits, strict=True)]
+        frontier_row_bits = connected_row_bits
+        while any(frontier_row_bits):
+            adjacent_row_bits = self.get_adjacent_row_bits(frontier_row_bits)
+            frontier_row_bits = [
+                adjacent & allowed & ~connected
+                for adjacent, allowed, connected in zip(
+                    adjacent_row_bits, allowed_row_bits, connected_row_bits, strict=True
+                )
+            ]
+            connected_row_bits = [
+                connected | frontier for connected, frontier in zip(connected_row_bits, frontier_row_bits, strict=True)
+            ]
+        return connected_row_bits
+
     def is_valid_cell_coordinate(self, grid_coordinate: GridCoordinate) -> bool:
         return (
             0 <= grid_coordinate.row_number < self.level.number_of_rows
@@ -133,34 +313,40 @@ class Board:
         self.paint_completed_gardens()
 
     def draw_all_cells(self) -> None:
-        for cell in self.flat_cell_list:
-            cell.draw_cell()
+        # Cells don't overlap, so the text of every cell can be drawn together after all the cell rects
+        with self.screen.batch_text_drawing():
+            for cell in self.flat_cell_list:
+                cell.draw_cell()
 
     def paint_completed_gardens(self) -> None:
         for garden in self.get_all_gardens():
             garden.paint_garden_if_completed()
 
-    def get_all_gardens(self) -> set[Garden]:
+    @versioned_cache
+    def get_all_gardens(self) -> frozenset[Garden]:
         all_cell_groups = self.get_all_cell_groups(cell_criteria_func=Garden.get_cell_criteria_func())
-        return {Garden(cell_group.cells) for cell_group in all_cell_groups}
+        return frozenset(Garden(cell_group.cells) for cell_group in all_cell_groups)
 
-    def get_all_weak_gardens(self) -> set[WeakGarden]:
+    @versioned_cache
+    def get_all_weak_gardens(self) -> frozenset[WeakGarden]:
         all_cell_groups = self.get_all_cell_groups(cell_criteria_func=WeakGarden.get_cell_criteria_func())
-        return {WeakGarden(cell_group.cells) for cell_group in all_cell_groups}
+        return frozenset(WeakGarden(cell_group.cells) for cell_group in all_cell_groups)
 
-    def get_all_wall_sections(self) -> set[WallSection]:
+    @versioned_cache
+    def get_all_wall_sections(self) -> frozenset[WallSection]:
         all_cell_groups = self.get_all_cell_groups(cell_criteria_func=WallSection.get_cell_criteria_func())
-        return {WallSection(cell_group.cells) for cell_group in all_cell_groups}
+        return frozenset(WallSection(cell_group.cells) for cell_group in all_cell_groups)
 
-    def get_all_cell_groups(self, cell_criteria_func: Callable[[Cell], bool]) -> set[CellGroup]:
-        all_cell_groups: set[CellGroup] = set()
+    def get_all_cell_groups(self, cell_criteria_func: Callable[[Cell], bool]) -> list[CellGroup]:
+        # Each cell group is only found once, so a list is enough and the cell groups do not need to be hashed
+        all_cell_groups: list[CellGroup] = []
         calls_already_in_a_group: set[Cell] = set()  # to prevent double counting
         for cell in self.flat_cell_list:
             if cell in calls_already_in_a_group or not cell_criteria_func(cell):
                 continue
             cell_group = self.get_cell_group(starting_cell=cell, cell_criteria_func=cell_criteria_func)
-            all_cell_groups.add(cell_group)
-            calls_already_in_a_group = calls_already_in_a_group.union(cell_group.cells)
+            all_cell_groups.append(cell_group)
+            calls_already_in_a_group.update(cell_group.cells)
         return all_cell_groups
 
     def get_garden(self, starting_cell: Cell) -> Garden:
@@ -175,23 +361,24 @@ class Board:
         cells = self.get_connected_cells(starting_cell, cell_criteria_func)
         return CellGroup(cells)
 
-    def get_connected_cells(
-        self, starting_cell: Cell, cell_criteria_func: Callable[[Cell], bool], connected_cells: set[Cell] | None = None
-    ) -> set[Cell]:
+    @staticmethod
+    def get_connected_cells(starting_cell: Cell, cell_criteria_func: Callable[[Cell], bool]) -> set[Cell]:
         """
         Get a list of cells that are connected (non-diagonally) to the starting cell where the cell_criteria_func
         returns True.
-        """
-        if connected_cells is None:
-            connected_cells = set()
-        if starting_cell in connected_cells:
-            # Already visited this cell
-            return connected_cells
-        if cell_criteria_func(starting_cell):
-            connected_cells.add(starting_cell)
-            for neighbor_cell in starting_cell.get_adjacent_neighbors():
-                self.get_connected_cells(neighbor_cell, cell_criteria_func, connected_cells)
 
+        This uses an explicit stack rather than recursion, so visited neighbors are skipped with a set lookup instead
+        of a function call and large cell groups cannot hit the recursion limit.
+        """
+        if not cell_criteria_func(starting_cell):
+            return set()
+        connected_cells = {starting_cell}
+        cells_to_visit = [starting_cell]
+        while cells_to_visit:
+            for neighbor_cell in cells_to_visit.pop().get_adjacent_neighbors():
+                if neighbor_cell not in connected_cells and cell_criteria_func(neighbor_cell):
+                    connected_cells.add(neighbor_cell)
+                    cells_to_visit.append(neighbor_cell)
         return connected_cells
 
     def freeze_cells(self) -> None:
@@ -200,23 +387,30 @@ class Board:
     def filter_cells(self, cell_criteria_func: Callable[[Cell], bool]) -> set[Cell]:
         return {cell for cell in self.flat_cell_list if cell_criteria_func(cell)}
 
+    def get_cells_in_states(self, *cell_states: CellState) -> set[Cell]:
+        """
+        Get the cells in any of the given cell states. This returns a new set, so callers are free to modify it without
+        affecting the sets the board keeps for each cell state.
+        """
+        return set().union(*(self.cells_by_state[cell_state] for cell_state in cell_states))
+
     def get_empty_cells(self) -> set[Cell]:
-        return self.filter_cells(lambda cell: cell.cell_state.is_empty())
+        return self.get_cells_in_states(CellState.EMPTY)
 
     def get_wall_cells(self) -> set[Cell]:
-        return self.filter_cells(lambda cell: cell.cell_state.is_wall())
+        return self.get_cells_in_states(CellState.WALL)
 
     def get_non_wall_cells(self) -> set[Cell]:
-        return self.filter_cells(lambda cell: cell.cell_state.is_non_wall())
+        return self.get_cells_in_states(CellState.NON_WALL)
 
     def get_clue_cells(self) -> set[Cell]:
-        return self.filter_cells(lambda cell: cell.cell_state.is_clue())
+        return self.get_cells_in_states(CellState.CLUE)
 
     def get_garden_cells(self) -> set[Cell]:
-        return self.filter_cells(lambda cell: cell.cell_state.is_garden())
+        return self.get_cells_in_states(CellState.NON_WALL, CellState.CLUE)
 
     def get_weak_garden_cells(self) -> set[Cell]:
-        return self.filter_cells(lambda cell: cell.cell_state.is_weak_garden())
+        return self.get_cells_in_states(CellState.NON_WALL, CellState.CLUE, CellState.EMPTY)
 
     def apply_cell_changes(self, cell_changes: CellChanges) -> None:
         for cell_change_info in cell_changes.cell_change_list:
@@ -226,30 +420,65 @@ class Board:
             )
             cell.update_cell_state(new_cell_state=cell_change_info.after_state)
 
+    def get_two_by_two_wall_row_bits(self) -> list[int]:
+        """
+        Get the row bitmasks of the cells that are the top-left corner of a two-by-two section of walls. Shifting a
+        row's wall bitmask right by one lines up each cell with its right neighbor, so a bit is only left set if the
+        cell, its right neighbor and the two cells below them are all walls. The bottom row is never a top-left corner.
+        """
+        wall_row_bits = self.state_bits[CellState.WALL]
+        two_by_two_wall_row_bits = [0] * self.level.number_of_rows
+        for row_number in range(self.level.number_of_rows - 1):
+            top_wall_bits = wall_row_bits[row_number]
+            bottom_wall_bits = wall_row_bits[row_number + 1]
+            two_by_two_wall_row_bits[row_number] = (
+                top_wall_bits & (top_wall_bits >> 1) & bottom_wall_bits & (bottom_wall_bits >> 1)
+            )
+        return two_by_two_wall_row_bits
+
     def has_two_by_two_wall(self) -> bool:
-        return any(cell.does_form_two_by_two_walls() for cell in self.flat_cell_list)
+        return any(self.get_two_by_two_wall_row_bits())
 
     def get_two_by_two_wall_sections(self) -> set[Cell]:
         two_by_two_wall_section_cells: set[Cell] = set()
-        for cell in self.flat_cell_list:
-            if cell.does_form_two_by_two_walls():
-                two_by_two_wall_section_cells.update(cell.get_two_by_two_section())
+        for cell in self.get_cells_from_all_row_bits(self.get_two_by_two_wall_row_bits()):
+            two_by_two_wall_section_cells.update(cell.get_two_by_two_section())
         return two_by_two_wall_section_cells
 
-    def get_all_non_garden_cell_groups_with_walls(
-        self, additional_off_limit_cell: Cell | None = None
-    ) -> set[CellGroup]:
+    @versioned_cache
+    def can_all_walls_connect(self) -> bool:
+        """
+        Returns True if all the wall cells are connected to each other through cells that are not gardens. This flood
+        fills over the state bitmasks from a single wall cell, so it does not need to build any cell groups.
+        """
+        wall_row_bits = self.state_bits[CellState.WALL]
+        first_wall_row_number = next((row_number for row_number, bits in enumerate(wall_row_bits) if bits), None)
+        if first_wall_row_number is None:
+            return True
+        seed_row_bits = [0] * self.level.number_of_rows
+        first_wall_bits = wall_row_bits[first_wall_row_number]
+        seed_row_bits[first_wall_row_number] = first_wall_bits & -first_wall_bits
+        non_garden_row_bits = [
+            wall_bits | empty_bits
+            for wall_bits, empty_bits in zip(wall_row_bits, self.state_bits[CellState.EMPTY], strict=True)
+        ]
+        connected_row_bits = self.get_connected_row_bits(seed_row_bits, non_garden_row_bits)
+        return all(
+            wall_bits & ~connected_bits == 0
+            for wall_bits, connected_bits in zip(wall_row_bits, connected_row_bits, strict=True)
+        )
+
+    @versioned_cache
+    def get_all_non_garden_cell_groups_with_walls(self) -> frozenset[CellGroup]:
         off_limit_cells = self.get_garden_cells()
-        if additional_off_limit_cell is not None:
-            off_limit_cells.add(additional_off_limit_cell)
         non_garden_cell_groups = self.get_all_cell_groups(
             cell_criteria_func=lambda cell: cell not in off_limit_cells,
         )
-        return {
+        return frozenset(
             non_garden_cell_group
             for non_garden_cell_group in non_garden_cell_groups
             if non_garden_cell_group.does_contain_wall()
-        }
+        )
 
     def as_simple_string_list(self) -> list[str]:
         """
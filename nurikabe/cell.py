@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import pygame
 
 from .cell_change_info import CellChangeInfo
-from .cell_state import CellState
+from .cell_state import VALID_CELL_STATES, CellState
 from .color import Color
 from .direction import ADJACENT_DIRECTIONS, Direction
 from .grid_coordinate import GridCoordinate
 from .rect_edge import RectEdge, get_rect_edges
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from .pixel_position import PixelPosition
     from .screen import Screen
@@ -24,12 +24,44 @@ class NonExistentNeighborError(Exception):
 
 class Cell:
     CENTER_DOT = '\u2022'
-
-    def __init__(
-        self, row_number: int, col_number: int, clue: int | None, pixel_position: PixelPosition, screen: Screen
+    TWO_BY_TWO_NEIGHBOR_DIRECTIONS = (Direction.RIGHT, Direction.RIGHT_DOWN, Direction.DOWN)
+    SIMPLE_STRING_BY_CELL_STATE: ClassVar[dict[CellState, str]] = {
+        CellState.EMPTY: '_',
+        CellState.WALL: 'W',
+        CellState.NON_WALL: 'O',
+    }
+
+    __slots__ = (
+        '_adjacent_neighbors',
+        '_hash',
+        '_key',
+        '_neighbor_cell_map',
+        '_state_change_callback',
+        'cell_state',
+        'clue',
+        'col_number',
+        'flat_index',
+        'grid_coordinate',
+        'has_clue',
+        'is_clickable',
+        'rect',
+        'row_number',
+        'screen',
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        row_number: int,
+        col_number: int,
+        flat_index: int,
+        clue: int | None,
+        pixel_position: PixelPosition,
+        screen: Screen,
     ):
         self.row_number = row_number
         self.col_number = col_number
+        # The index of the cell in the board's flat cell list
+        self.flat_index = flat_index
         self.grid_coordinate = GridCoordinate(row_number, col_number)
         self.clue = clue
         self.screen = screen
@@ -46,6 +78,7 @@ class Cell:
 
         self._neighbor_cell_map: dict[Direction, Cell] | None = None
         self._adjacent_neighbors: set[Cell] | None = None
+        self._state_change_callback: Callable[[Cell, CellState], None] | None = None
 
     def _get_key(self) -> tuple[int, int, int]:
         clue_int = 0 if self.clue is None else self.clue
@@ -135,6 +168,10 @@ class Cell:
             raise RuntimeError(msg)
         return self._adjacent_neighbors
 
+    def set_state_change_callback(self, state_change_callback: Callable[[Cell, CellState], None]) -> None:
+        """Set a function to be called with this cell and its previous state whenever the cell state changes."""
+        self._state_change_callback = state_change_callback
+
     def is_inside_cell(self, event_position: PixelPosition) -> bool:
         return self.rect.collidepoint(event_position.coordinates)
 
@@ -147,7 +184,18 @@ class Cell:
 
     def update_cell_state(self, new_cell_state: CellState) -> CellChangeInfo:
         old_cell_state = self.cell_state
+        if new_cell_state is old_cell_state:
+            # Nothing changes, so there is no need to notify the board, which would invalidate its cached results, or to
+            # redraw the cell
+            return CellChangeInfo(
+                grid_coordinate=self.grid_coordinate, before_state=old_cell_state, after_state=old_cell_state
+            )
+        if new_cell_state not in VALID_CELL_STATES:
+            msg = f'Not a valid cell state: {new_cell_state!r}'
+            raise ValueError(msg)
         self.cell_state = new_cell_state
+        if self._state_change_callback is not None:
+            self._state_change_callback(self, old_cell_state)
         self.draw_cell()
         return CellChangeInfo(
             grid_coordinate=self.grid_coordinate, before_state=old_cell_state, after_state=self.cell_state
@@ -160,23 +208,12 @@ class Cell:
         try:
             return self.get_neighbor_map()[direction]
         except KeyError:
-            msg = f'{self} has no neighbor in {direction}'
+            msg = f'{self} has no neighbor in {direction.name}'
             raise NonExistentNeighborError(msg) from None
 
-    def does_form_two_by_two_walls(self) -> bool:
-        """Returns True if this cell is the top left corner of a two by two section of walls."""
-        try:
-            two_by_two_section = self.get_two_by_two_section()
-            return all(cell.cell_state.is_wall() for cell in two_by_two_section)
-        except NonExistentNeighborError:
-            # Can't be top-left of two by two since this is on the right or lower edge of board so the required
-            # neighbors do not exist
-            return False
-
     def get_two_by_two_section(self) -> set[Cell]:
         """Return the two-by-two section of cells where this cell is the top-left corner."""
-        direction_list = (Direction.RIGHT, Direction.RIGHT_DOWN, Direction.DOWN)
-        neighbor_cells = self.get_neighbor_set(direction_list)
+        neighbor_cells = self.get_neighbor_set(self.TWO_BY_TWO_NEIGHBOR_DIRECTIONS)
         return neighbor_cells.union({self})
 
     def has_any_clues_adjacent(self) -> bool:
@@ -193,19 +230,13 @@ class Cell:
         return get_rect_edges(self.rect)
 
     def __repr__(self) -> str:
-        return f'Cell(row={self.row_number}, col={self.col_number}, state={self.cell_state}, clue={self.clue})'
+        return f'Cell(row={self.row_number}, col={self.col_number}, state={self.cell_state.name}, clue={self.clue})'
 
     def as_simple_string(self) -> str:
         """Useful for printing the board with each cell state shown as a simple string."""
         if self.cell_state.is_clue():
-            cell_str = str(self.clue)
-        else:
-            cell_str = {
-                CellState.EMPTY: '_',
-                CellState.WALL: 'W',
-                CellState.NON_WALL: 'O',
-            }[self.cell_state]
-        return cell_str
+            return str(self.clue)
+        return self.SIMPLE_STRING_BY_CELL_STATE[self.cell_state]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Cell):
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from .grid_coordinate import GridCoordinate
 
 
-@dataclass
+@dataclass(slots=True)
 class CellChangeInfo:
     grid_coordinate: GridCoordinate
     before_state: CellState
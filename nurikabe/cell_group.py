@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from .cell import Cell
     from .color import Color
@@ -24,29 +24,66 @@ class CellGroup:
     def get_cell_criteria_func() -> Callable[[Cell], bool]:
         raise NotImplementedError('Unknown criteria for general CellGroup')  # noqa: EM101
 
-    def __init__(self, cells: set[Cell]):
-        self.cells = cells
+    def __init__(self, cells: Iterable[Cell]):
+        # The cells are stored as a frozenset so they cannot change, which the cached values below depend on
+        self.cells = frozenset(cells)
+        self._number_of_clues: int | None = None
+        self._clue_cell: Cell | None = None
+        self._hash: int | None = None
+        self._adjacent_neighbors: frozenset[Cell] | None = None
 
     def get_empty_adjacent_neighbors(self) -> set[Cell]:
         adjacent_neighbors = self.get_adjacent_neighbors()
         return {cell for cell in adjacent_neighbors if cell.cell_state.is_empty()}
 
-    def get_adjacent_neighbors(self) -> set[Cell]:
-        list_of_neighbor_cell_sets: list[set[Cell]] = [cell.get_adjacent_neighbors() for cell in self.cells]
-        return {
-            cell for neighbor_cells in list_of_neighbor_cell_sets for cell in neighbor_cells if cell not in self.cells
-        }
+    def get_empty_adjacent_neighbors_up_to(self, limit: int) -> list[Cell]:
+        """
+        Get at most limit of the empty adjacent neighbors. This stops looking as soon as limit of them are found, which
+        is cheaper than get_empty_adjacent_neighbors when only a few are needed, e.g. to check if there is exactly one.
+        """
+        empty_adjacent_neighbors: list[Cell] = []
+        for cell in self.cells:
+            for neighbor_cell in cell.get_adjacent_neighbors():
+                if (
+                    neighbor_cell.cell_state.is_empty()
+                    and neighbor_cell not in self.cells
+                    and neighbor_cell not in empty_adjacent_neighbors
+                ):
+                    empty_adjacent_neighbors.append(neighbor_cell)
+                    if len(empty_adjacent_neighbors) >= limit:
+                        return empty_adjacent_neighbors
+        return empty_adjacent_neighbors
+
+    def get_adjacent_neighbors(self) -> frozenset[Cell]:
+        # The cells in a group and their neighbors never change, so the adjacent neighbors only need to be found once
+        if self._adjacent_neighbors is None:
+            list_of_neighbor_cell_sets: list[set[Cell]] = [cell.get_adjacent_neighbors() for cell in self.cells]
+            self._adjacent_neighbors = frozenset(
+                cell
+                for neighbor_cells in list_of_neighbor_cell_sets
+                for cell in neighbor_cells
+                if cell not in self.cells
+            )
+        return self._adjacent_neighbors
 
     def does_contain_clue(self) -> bool:
         return self.get_number_of_clues() > 0
 
     def get_number_of_clues(self) -> int:
-        return len([cell for cell in self.cells if cell.has_clue])
+        # The cells in a group and their clues never change, so the clues only need to be counted once
+        if self._number_of_clues is None:
+            self._number_of_clues = sum(1 for cell in self.cells if cell.has_clue)
+        return self._number_of_clues
 
     def get_clue_value(self) -> int:
         return self.get_clue_cell().get_non_null_clue()
 
     def get_clue_cell(self) -> Cell:
+        if self._clue_cell is None:
+            self._clue_cell = self.find_clue_cell()
+        return self._clue_cell
+
+    def find_clue_cell(self) -> Cell:
         number_of_clues = self.get_number_of_clues()
         if number_of_clues == 0:
             msg = 'Cannot get clue cell since there are no clues in this CellGroup'
@@ -66,15 +103,37 @@ class CellGroup:
     def get_shortest_manhattan_distance_to_cell(self, destination_cell: Cell) -> int:
         return min([source_cell.get_manhattan_distance(destination_cell) for source_cell in self.cells])
 
+    def get_shortest_manhattan_distance_to_cells(self, destination_cells: Iterable[Cell]) -> dict[Cell, int]:
+        """
+        Get a mapping of destination cell to its shortest Manhattan distance from this CellGroup. The coordinates of
+        this CellGroup are extracted once so that the distances can be used as a cheap sort key.
+        """
+        source_coordinates = [(source_cell.row_number, source_cell.col_number) for source_cell in self.cells]
+        return {
+            destination_cell: min(
+                abs(row_number - destination_cell.row_number) + abs(col_number - destination_cell.col_number)
+                for row_number, col_number in source_coordinates
+            )
+            for destination_cell in destination_cells
+        }
+
     def get_shortest_naive_path_length_to_cell(self, destination_cell: Cell) -> int:
         return self.get_shortest_manhattan_distance_to_cell(destination_cell) + 1
 
     def get_shortest_manhattan_distance_to_cell_group(self, destination_cell_group: CellGroup) -> int:
+        """
+        The coordinates of both CellGroups are extracted once so that each pair of cells only costs a little integer
+        arithmetic rather than a call to Cell.get_manhattan_distance.
+        """
+        source_coordinates = [(source_cell.row_number, source_cell.col_number) for source_cell in self.cells]
+        destination_coordinates = [
+            (destination_cell.row_number, destination_cell.col_number)
+            for destination_cell in destination_cell_group.cells
+        ]
         return min(
-            [
-                self.get_shortest_manhattan_distance_to_cell(cell_in_destination_group)
-                for cell_in_destination_group in destination_cell_group.cells
-            ]
+            abs(source_row_number - destination_row_number) + abs(source_col_number - destination_col_number)
+            for source_row_number, source_col_number in source_coordinates
+            for destination_row_number, destination_col_number in destination_coordinates
         )
 
     def get_shortest_naive_path_length_to_cell_group(self, destination_cell_group: CellGroup) -> int:
@@ -89,12 +148,22 @@ class CellGroup:
         Get the set of edges of the cell group. Note that this just includes the outer edges. It does not include the
         cell edges that are common to more than one cell in the cell group.
         """
-        all_cell_edges = [rect_edge for cell in self.cells for rect_edge in cell.get_edges()]
-        return {cell_edges for cell_edges in all_cell_edges if all_cell_edges.count(cell_edges) == 1}
+        edges_seen: set[RectEdge] = set()
+        common_edges: set[RectEdge] = set()
+        for cell in self.cells:
+            for rect_edge in cell.get_edges():
+                if rect_edge in edges_seen:
+                    common_edges.add(rect_edge)
+                else:
+                    edges_seen.add(rect_edge)
+        return edges_seen - common_edges
 
     def does_include_cell(self, cells: set[Cell]) -> bool:
         return len(self.cells.intersection(cells)) > 0
 
+    def is_adjacent_to_any_cell(self, cells: Iterable[Cell]) -> bool:
+        return any(not self.cells.isdisjoint(cell.get_adjacent_neighbors()) for cell in cells)
+
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
         cell_string_set = {str(cell) for cell in self.cells}
@@ -106,5 +175,8 @@ class CellGroup:
         return self.cells == other_cell_group.cells
 
     def __hash__(self) -> int:
-        sorted_cells = tuple(sorted(self.cells, key=lambda cell: (cell.row_number, cell.col_number)))
-        return hash(sorted_cells)
+        # The cells in a group never change, so the hash only needs to be calculated once. Hashing a frozenset does not
+        # depend on the order of the cells, so they do not need to be sorted first.
+        if self._hash is None:
+            self._hash = hash(self.cells)
+        return self._hash
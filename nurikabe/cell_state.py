@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from enum import Enum, auto
+from enum import IntFlag, auto
 
 
-class CellState(Enum):
+class CellState(IntFlag):
+    """
+    The state of a cell. Each state is a distinct bit, and being an IntFlag means states hash and compare as plain ints
+    which keeps dicts keyed by CellState cheap to look up.
+
+    Only the four single-bit members below are valid cell states. IntFlag also allows values such as CellState(0) or
+    WALL | EMPTY, but a cell can never be in one of those, so Cell.update_cell_state rejects them. IntFlag also formats
+    as its integer value with %s, so use .name when a state is shown in a message.
+    """
+
     EMPTY = auto()
     WALL = auto()
     NON_WALL = auto()
@@ -22,10 +31,10 @@ class CellState(Enum):
         return self is CellState.CLUE
 
     def is_garden(self) -> bool:
-        return self.is_non_wall() or self.is_clue()
+        return self is CellState.NON_WALL or self is CellState.CLUE
 
     def is_weak_garden(self) -> bool:
-        return self.is_garden() or self.is_empty()
+        return self is CellState.EMPTY or self is CellState.NON_WALL or self is CellState.CLUE
 
     def get_next_in_cycle(self) -> CellState:
         """When the user clicks on a cell, it cycles through these states."""
@@ -42,3 +51,7 @@ class CellState(Enum):
             msg = 'This should not be possible'
             raise RuntimeError(msg)
         return cell_state
+
+
+# The only values a cell's state can take. Zero or combined CellState values are not in this set.
+VALID_CELL_STATES = frozenset({CellState.EMPTY, CellState.WALL, CellState.NON_WALL, CellState.CLUE})
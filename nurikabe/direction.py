@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class Direction(Enum):
+class Direction(IntEnum):
     UP = auto()
     DOWN = auto()
     RIGHT = auto()
@@ -16,7 +16,7 @@ class Direction(Enum):
 ADJACENT_DIRECTIONS = (Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GridOffset:
     row_offset: int
     col_offset: int
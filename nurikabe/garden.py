@@ -1,6 +1,7 @@
 from collections.abc import Callable
 
 from .cell import Cell
+from .cell_state import CellState
 from .weak_garden import WeakGarden
 
 
@@ -13,7 +14,12 @@ class Garden(WeakGarden):
 
     @staticmethod
     def get_cell_criteria_func() -> Callable[[Cell], bool]:
-        return lambda cell: cell.cell_state.is_garden()
+        return Garden.is_garden_cell
+
+    @staticmethod
+    def is_garden_cell(cell: Cell) -> bool:
+        cell_state = cell.cell_state
+        return cell_state is CellState.NON_WALL or cell_state is CellState.CLUE
 
     def get_num_of_remaining_garden_cells(self) -> int:
         expected_garden_size = self.get_expected_garden_size()
@@ -4,6 +4,8 @@ from .direction import OFFSET_MAP, Direction
 
 
 class GridCoordinate:
+    __slots__ = ('col_number', 'row_number')
+
     def __init__(self, row_number: int, col_number: int):
         self.row_number = row_number
         self.col_number = col_number
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 
 class PixelPosition:
+    __slots__ = ('coordinates', 'x_coordinate', 'y_coordinate')
+
     def __init__(self, x_coordinate: int, y_coordinate: int):
         self.x_coordinate = x_coordinate
         self.y_coordinate = y_coordinate
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import pygame
 
 from .color import Color
@@ -53,11 +56,18 @@ class Screen:
             TextType.GRID_NUMBERING: self.get_grid_numbering_font(),
         }
 
+        # Rendering anti-aliased text is expensive and the same few strings (clues, the non-wall dot, button labels,
+        # grid numbers) are drawn over and over, so each rendered text surface is kept for reuse
+        self.text_surface_cache: dict[tuple[TextType, str, Color], pygame.Surface] = {}
+
+        # While drawing is batched, text is collected here and blitted in one call at the end of the batch
+        self.batched_text_blits: list[tuple[pygame.Surface, pygame.Rect]] | None = None
+
         if should_include_grid_numbers:
             self.display_grid_numbering(level)
 
     def get_top_left_of_game_status(self) -> PixelPosition:
-        left = int((self.SCREEN_WIDTH - self.GAME_STATUS_RECT_WIDTH) / 2)
+        left = (self.SCREEN_WIDTH - self.GAME_STATUS_RECT_WIDTH) // 2
         top = self.SCREEN_HEIGHT - (self.GAME_STATUS_RECT_HEIGHT + self.MIN_BORDER)
         return PixelPosition(x_coordinate=left, y_coordinate=top)
 
@@ -67,14 +77,14 @@ class Screen:
             + self.get_right_side_of_board_width()
         )
         max_board_width = self.SCREEN_WIDTH - width_for_non_board_components
-        max_cell_width = int(max_board_width / number_of_columns)
+        max_cell_width = max_board_width // number_of_columns
 
         height_for_non_board_components = (
             self.get_top_of_board_height(should_include_grid_numbers=should_include_grid_numbers)
             + self.get_bottom_of_board_height()
         )
         max_board_height = self.SCREEN_HEIGHT - height_for_non_board_components
-        max_cell_height = int(max_board_height / number_of_rows)
+        max_cell_height = max_board_height // number_of_rows
 
         return min((max_cell_width, max_cell_height))
 
@@ -109,7 +119,7 @@ class Screen:
         else:
             # Ensure that the board is centered on the screen for cleanliness
             board_width = self.cell_width * number_of_columns
-            left_border_size = int((Screen.SCREEN_WIDTH - board_width) / 2)
+            left_border_size = (Screen.SCREEN_WIDTH - board_width) // 2
         top_border_size = self.get_top_of_board_height(should_include_grid_numbers=should_include_grid_numbers)
         return PixelPosition(x_coordinate=left_border_size, y_coordinate=top_border_size)
 
@@ -195,10 +205,34 @@ class Screen:
             self.screen.blit(image, dest=image_rect.topleft)
 
     def draw_text(self, rect: pygame.Rect, text: str, text_color: Color, text_type: TextType) -> None:
-        font = self.font_map[text_type]
-        text_surface = font.render(text, self.SHOULD_APPLY_ANTI_ALIAS, text_color.value)
+        text_surface = self.get_text_surface(text, text_color, text_type)
         text_rect = text_surface.get_rect(center=rect.center)
-        self.screen.blit(text_surface, text_rect)
+        if self.batched_text_blits is None:
+            self.screen.blit(text_surface, text_rect)
+        else:
+            self.batched_text_blits.append((text_surface, text_rect))
+
+    @contextmanager
+    def batch_text_drawing(self) -> Iterator[None]:
+        """
+        Defer drawing text until the end of the with block, then blit all of it with a single call. This is only safe
+        when no later drawing in the block overlaps earlier text, e.g. when drawing each cell of the board once.
+        """
+        self.batched_text_blits = []
+        try:
+            yield
+        finally:
+            batched_text_blits, self.batched_text_blits = self.batched_text_blits, None
+            self.screen.blits(batched_text_blits, doreturn=False)
+
+    def get_text_surface(self, text: str, text_color: Color, text_type: TextType) -> pygame.Surface:
+        text_surface_key = (text_type, text, text_color)
+        text_surface = self.text_surface_cache.get(text_surface_key)
+        if text_surface is None:
+            font = self.font_map[text_type]
+            text_surface = font.render(text, self.SHOULD_APPLY_ANTI_ALIAS, text_color.value)
+            self.text_surface_cache[text_surface_key] = text_surface
+        return text_surface
 
     def draw_edge(self, rect_edge: RectEdge, color: Color, width: int) -> None:
         pygame.draw.line(
@@ -41,8 +41,11 @@ class BoardStateChecker:
                 problem_cell_groups=frozenset({CellGroup(self.board.get_two_by_two_wall_sections())}),
             )
 
-    def check_for_isolated_walls(self, non_garden_cell_groups_with_walls: set[CellGroup] | None = None) -> None:
+    def check_for_isolated_walls(self, non_garden_cell_groups_with_walls: frozenset[CellGroup] | None = None) -> None:
         if non_garden_cell_groups_with_walls is None:
+            if self.board.can_all_walls_connect():
+                # The cell groups are only needed to report which walls are isolated
+                return
             non_garden_cell_groups_with_walls = self.board.get_all_non_garden_cell_groups_with_walls()
         if len(non_garden_cell_groups_with_walls) > 1:
             largest_non_garden_cell_group = max(
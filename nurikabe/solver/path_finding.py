@@ -1,6 +1,6 @@
-import math
-import queue
-from dataclasses import dataclass, field
+import heapq
+import sys
+from collections.abc import Iterator
 
 from ..cell import Cell
 from ..cell_group import CellGroup
@@ -15,14 +15,6 @@ class PathSetupError(Exception):
     """Indicates that there was something wrong with how the path finding problem was defined."""
 
 
-@dataclass(order=True)
-class PrioritizedCell:
-    """Used in the A* path finding algorithm to determine the next cell to investigate."""
-
-    priority: int
-    cell: Cell = field(compare=False)
-
-
 class PathFinder:
     """
     Uses A* algorithm to find the shortest path between two cell groups. The wiki page has a great explanation of the
@@ -65,6 +57,18 @@ class PathFinder:
         else:
             self.other_cell_groups = other_cell_groups
 
+        # The search looks cells up by their flat index since hashing an int is much cheaper than hashing a Cell
+        self.start_flat_indexes = {cell.flat_index for cell in self.start_cell_group.cells}
+        self.end_flat_indexes = {cell.flat_index for cell in self.end_cell_group.cells}
+        self.off_limit_flat_indexes = {cell.flat_index for cell in self.off_limit_cells}
+        self.other_cell_groups_flat_indexes = {
+            cell.flat_index for other_cell_group in self.other_cell_groups for cell in other_cell_group.cells
+        }
+
+        # The min possible remaining distance from a cell only depends on the cell for a given path finding problem, so
+        # it is cached by flat index the first time it is calculated for each cell
+        self.min_possible_remaining_distance_by_flat_index: dict[int, int] = {}
+
         self.check_path_finding_setup()
 
     @staticmethod
@@ -79,10 +83,10 @@ class PathFinder:
         return cell_group
 
     def check_path_finding_setup(self) -> None:
-        if len(self.start_cell_group.cells.intersection(self.off_limit_cells)) > 0:
+        if not self.start_flat_indexes.isdisjoint(self.off_limit_flat_indexes):
             msg = 'Cannot find path since a cell in the start cell group is off limits'
             raise PathSetupError(msg)
-        if len(self.end_cell_group.cells.intersection(self.off_limit_cells)) > 0:
+        if not self.end_flat_indexes.isdisjoint(self.off_limit_flat_indexes):
             msg = 'Cannot find path since a cell in the end cell group is off limits'
             raise PathSetupError(msg)
 
@@ -91,7 +95,7 @@ class PathFinder:
             if len(other_cell_group.cells.intersection(cells_adjacent_to_start_cell_group)) > 0:
                 msg = 'Start cell group is adjacent to a cell in the other_cell_groups'
                 raise PathSetupError(msg)
-            if len(other_cell_group.cells.intersection(self.off_limit_cells)) > 0:
+            if not self.off_limit_flat_indexes.isdisjoint(cell.flat_index for cell in other_cell_group.cells):
                 msg = 'An off limit cell is is also part of other_cell_groups'
                 raise PathSetupError(msg)
 
@@ -123,34 +127,52 @@ class PathFinder:
         if max_path_length is not None and min_possible_path_length > max_path_length:
             raise NoPathFoundError(self.get_no_path_error_string(max_path_length))
 
-        # Keep a prioritized queue of cells to explore. Start with a random cell in the start cell group.
-        prioritized_cells_to_explore: queue.PriorityQueue[PrioritizedCell] = queue.PriorityQueue()
+        # Keep a heap of (priority, tie breaker, path length, cell) entries to explore. The tie breaker keeps cells with
+        # equal priority in the order they were added so that cells never need to be compared. A cell is pushed again
+        # whenever a shorter path to it is found, and the outdated entries are skipped when they are popped. Start with
+        # a random cell in the start cell group.
+        prioritized_cells_to_explore: list[tuple[int, int, int, Cell]] = []
         start_cell = next(iter(self.start_cell_group.cells))
-        prioritized_cells_to_explore.put(PrioritizedCell(priority=min_possible_path_length, cell=start_cell))
+        tie_breaker = 0
+        heapq.heappush(prioritized_cells_to_explore, (min_possible_path_length, tie_breaker, 1, start_cell))
 
         # Keep track of the details on how the path got from the start cell group to each cell. We can't just use a
         # simple map from each cell to its parent cell since the "length" of a step from cell A to cell B may depend on
-        # the path taken to get to the cell A due to how adjacent cell groups are handled.
-        path_info_to_cell: dict[Cell, PathInfo] = {start_cell: PathInfo(cell_list=[start_cell], path_length=1)}
+        # the path taken to get to the cell A due to how adjacent cell groups are handled. The map is keyed by the flat
+        # index of each cell.
+        path_info_to_cell: dict[int, PathInfo] = {start_cell.flat_index: PathInfo(last_cell=start_cell, path_length=1)}
 
-        while not prioritized_cells_to_explore.empty():
+        while prioritized_cells_to_explore:
             # Take the next cell to explore from the priority queue
-            current_cell = prioritized_cells_to_explore.get().cell
+            _, _, path_length_to_current_cell, current_cell = heapq.heappop(prioritized_cells_to_explore)
+
+            # Skip this entry if a shorter path to the cell was found after it was added
+            path_info_to_current_cell = path_info_to_cell[current_cell.flat_index]
+            if path_length_to_current_cell > path_info_to_current_cell.path_length:
+                continue
 
             # If this cell is in the end_cell_group, then we have found the optimal path
-            if current_cell in self.end_cell_group.cells:
-                return path_info_to_cell[current_cell]
-
-            # Get the list of non-off-limit cells that neighbor the current cell
-            neighbor_cells_to_explore = [
-                neighbor_cell
-                for neighbor_cell in current_cell.get_adjacent_neighbors()
-                if neighbor_cell not in self.off_limit_cells
-            ]
-
-            unvisited_other_cell_groups = self.other_cell_groups - path_info_to_cell[current_cell].adjacent_cell_groups
-            for neighbor_cell in neighbor_cells_to_explore:
+            if current_cell.flat_index in self.end_flat_indexes:
+                return path_info_to_current_cell
+
+            unvisited_other_cell_groups = self.other_cell_groups - path_info_to_current_cell.adjacent_cell_groups
+
+            for neighbor_cell in self.get_neighbor_cells_to_explore(current_cell):
+                # Get the g-score of the best path found so far to this neighbor cell
+                path_info_to_neighbor_cell = path_info_to_cell.get(neighbor_cell.flat_index)
+                if path_info_to_neighbor_cell is None:
+                    # Use a large int rather than infinity so that the comparisons below stay between ints
+                    existing_g_score_for_neighbor = sys.maxsize
+                else:
+                    existing_g_score_for_neighbor = path_info_to_neighbor_cell.path_length
+
+                # Newly adjacent cell groups can only add to the distance, so if the step alone can't improve on the
+                # existing path to the neighbor cell, then skip looking for the adjacent cell groups
                 distance_from_current_to_neighbor = self.get_distance_between_cells(current_cell, neighbor_cell)
+                min_tentative_g_score = path_info_to_current_cell.path_length + distance_from_current_to_neighbor
+                if min_tentative_g_score >= existing_g_score_for_neighbor:
+                    continue
+
                 newly_adjacent_cell_groups = self.get_adjacent_cell_groups(neighbor_cell, unvisited_other_cell_groups)
                 size_of_newly_adjacent_cell_groups = sum(
                     len(newly_adjacent_cell_group.cells) for newly_adjacent_cell_group in newly_adjacent_cell_groups
@@ -159,7 +181,7 @@ class PathFinder:
 
                 # Determine the tentative g-score for the neighbor using the current best known optimal path to the
                 # neighbor cell through the current cell
-                tentative_g_score = path_info_to_cell[current_cell].path_length + distance_from_current_to_neighbor
+                tentative_g_score = path_info_to_current_cell.path_length + distance_from_current_to_neighbor
 
                 # If the tentative g-score is larger than the max allowed path length, then this potential path is not
                 # viable
@@ -169,42 +191,45 @@ class PathFinder:
                 # Check if we already have found a shorter potential path length that goes through this neighbor cell.
                 # If not, then we should extend the current path we are exploring through the neighbor cell by adding it
                 # to the priority queue.
-                if neighbor_cell in path_info_to_cell:
-                    existing_g_score_for_neighbor = float(path_info_to_cell[neighbor_cell].path_length)
-                else:
-                    existing_g_score_for_neighbor = math.inf
                 if tentative_g_score < existing_g_score_for_neighbor:
                     # This path is better than any previous one, so save the info on how we got here
-                    path_info_to_neighbor_cell = path_info_to_cell[current_cell].get_extended_path_info(
+                    path_info_to_neighbor_cell = path_info_to_current_cell.get_extended_path_info(
                         new_cell=neighbor_cell,
                         additional_path_length=distance_from_current_to_neighbor,
                         additional_adjacent_cell_groups=newly_adjacent_cell_groups,
                     )
-                    path_info_to_cell[neighbor_cell] = path_info_to_neighbor_cell
+                    path_info_to_cell[neighbor_cell.flat_index] = path_info_to_neighbor_cell
 
                     # Set the priority for exploring this neighbor cell further. The priority is the shortest known path
                     # length to get to this neighbor cell, plus the minimum possible distance to go from the neighbor
                     # cell to the end cell group
                     min_possible_remaining_distance = self.get_min_possible_remaining_distance(neighbor_cell)
                     f_score = tentative_g_score + min_possible_remaining_distance
-                    cells_in_prioritized_cells_to_explore = {
-                        prioritized_cell.cell for prioritized_cell in prioritized_cells_to_explore.queue
-                    }
-
-                    # TODO: I think we need to replace in the priority queue even if it's already there.
-                    #  Or do we - since if we're finding the same path it maybe can't be shorter??
-                    if neighbor_cell not in cells_in_prioritized_cells_to_explore:
-                        prioritized_cells_to_explore.put(PrioritizedCell(priority=f_score, cell=neighbor_cell))
+                    tie_breaker += 1
+                    heapq.heappush(
+                        prioritized_cells_to_explore, (f_score, tie_breaker, tentative_g_score, neighbor_cell)
+                    )
 
         raise NoPathFoundError(self.get_no_path_error_string(max_path_length))
 
+    def get_neighbor_cells_to_explore(self, current_cell: Cell) -> Iterator[Cell]:
+        """
+        Get the non-off-limit cells that neighbor the current cell. The adjacent neighbors of each cell are set up once
+        by the board, so they are filtered lazily rather than copied into a new list for every explored cell.
+        """
+        return (
+            neighbor_cell
+            for neighbor_cell in current_cell.get_adjacent_neighbors()
+            if neighbor_cell.flat_index not in self.off_limit_flat_indexes
+        )
+
     def get_distance_between_cells(self, current_cell: Cell, neighbor_cell: Cell) -> int:
         """Get the distance between the current cell and the neighbor cell."""
-        if current_cell in self.start_cell_group.cells and neighbor_cell in self.start_cell_group.cells:
+        if current_cell.flat_index in self.start_flat_indexes and neighbor_cell.flat_index in self.start_flat_indexes:
             # If both the current and the neighbor cell are part of the start_cell_group, then the distance is
             # considered zero
             distance_between_cells = 0
-        elif any(neighbor_cell in other_cell_group.cells for other_cell_group in self.other_cell_groups):
+        elif neighbor_cell.flat_index in self.other_cell_groups_flat_indexes:
             # Once the path steps adjacent to a cell in the other_cell_groups, the size of the cell group is added to
             # the path "length". Further steps into the cell group have zero additional cost. Therefore, if the neighbor
             # cell is part of the other_cell_groups, then the "distance" is zero. Note that this does not apply to
@@ -225,6 +250,17 @@ class PathFinder:
         }
 
     def get_min_possible_remaining_distance(self, neighbor_cell: Cell) -> int:
+        min_possible_remaining_distance = self.min_possible_remaining_distance_by_flat_index.get(
+            neighbor_cell.flat_index
+        )
+        if min_possible_remaining_distance is None:
+            min_possible_remaining_distance = self.calculate_min_possible_remaining_distance(neighbor_cell)
+            self.min_possible_remaining_distance_by_flat_index[neighbor_cell.flat_index] = (
+                min_possible_remaining_distance
+            )
+        return min_possible_remaining_distance
+
+    def calculate_min_possible_remaining_distance(self, neighbor_cell: Cell) -> int:
         cell_group_containing_neighbor_cell: CellGroup | None = None
         for cell_group in self.other_cell_groups:
             if neighbor_cell in cell_group.cells:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,9 +9,23 @@ if TYPE_CHECKING:
 
 
 class PathInfo:
-    def __init__(self, cell_list: list[Cell], path_length: int, adjacent_cell_groups: set[CellGroup] | None = None):
-        self.cell_list = cell_list
+    def __init__(
+        self,
+        last_cell: Cell,
+        path_length: int,
+        adjacent_cell_groups: set[CellGroup] | None = None,
+        previous_path_info: PathInfo | None = None,
+    ):
+        """
+        :param last_cell: The last cell in the path.
+        :param path_length: The "length" of the path, including both the start and last cell.
+        :param adjacent_cell_groups: The other cell groups that the path has gone adjacent to.
+        :param previous_path_info: The info for the path up to the cell before last_cell. This is None if the path only
+            contains last_cell. Linking to the previous path means extending a path doesn't need to copy its cells.
+        """
+        self.last_cell = last_cell
         self.path_length = path_length
+        self.previous_path_info = previous_path_info
 
         if adjacent_cell_groups is None:
             self.adjacent_cell_groups: set[CellGroup] = set()
@@ -20,11 +35,21 @@ class PathInfo:
     def add_adjacent_to_cell_group(self, cell_group: CellGroup) -> None:
         self.adjacent_cell_groups.add(cell_group)
 
+    def get_cell_list(self) -> list[Cell]:
+        """Get the cells in the path in order from the start cell to the last cell."""
+        cells: deque[Cell] = deque()
+        path_info: PathInfo | None = self
+        while path_info is not None:
+            cells.appendleft(path_info.last_cell)
+            path_info = path_info.previous_path_info
+        return list(cells)
+
     def get_extended_path_info(
         self, new_cell: Cell, additional_path_length: int, additional_adjacent_cell_groups: set[CellGroup]
     ) -> PathInfo:
         return PathInfo(
-            cell_list=[*self.cell_list, new_cell],
+            last_cell=new_cell,
             path_length=self.path_length + additional_path_length,
             adjacent_cell_groups=self.adjacent_cell_groups.union(additional_adjacent_cell_groups),
+            previous_path_info=self,
         )
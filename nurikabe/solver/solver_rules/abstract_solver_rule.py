@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from ...board import Board
 from ...cell import Cell
@@ -23,14 +24,30 @@ class SolverRule(ABC):
         if not cell.is_clickable:
             msg = f'cell is not clickable: {cell}'
             raise RuntimeError(msg)
-        logger.debug('Setting %s to %s. Reason: %s', cell, target_cell_state, reason)
+        logger.debug('Setting %s to %s. Reason: %s', cell, target_cell_state.name, reason)
         return cell.update_cell_state(target_cell_state)
 
-    def get_incomplete_gardens(self, *, with_clue_only: bool) -> set[Garden]:
+    @staticmethod
+    def set_cells_to_state(cells: Iterable[Cell], target_cell_state: CellState, reason: str) -> CellChanges:
+        """
+        Set each of the cells to the target_cell_state and collect all the changes in a single CellChanges. All the
+        cells are checked before any of them change, and the reason is logged once for the whole batch.
+        """
+        cells_to_set = list(cells)
+        if not cells_to_set:
+            return CellChanges()
+        for cell in cells_to_set:
+            if not cell.is_clickable:
+                msg = f'cell is not clickable: {cell}'
+                raise RuntimeError(msg)
+        logger.debug('Setting %s to %s. Reason: %s', cells_to_set, target_cell_state.name, reason)
+        return CellChanges([cell.update_cell_state(target_cell_state) for cell in cells_to_set])
+
+    def get_incomplete_gardens(self, *, with_clue_only: bool) -> list[Garden]:
         all_gardens = self.board.get_all_gardens()
-        incomplete_gardens = {
+        incomplete_gardens = [
             garden for garden in all_gardens if not garden.does_contain_clue() or not garden.is_garden_correct_size()
-        }
+        ]
         if with_clue_only:
-            incomplete_gardens = {garden for garden in incomplete_gardens if garden.does_contain_clue()}
+            incomplete_gardens = [garden for garden in incomplete_gardens if garden.does_contain_clue()]
         return incomplete_gardens
@@ -1,13 +1,23 @@
-from ...cell_change_info import CellChanges
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ...cell_state import CellState
 from ..board_state_checker import NoPossibleSolutionFromCurrentStateError
 from .abstract_solver_rule import SolverRule
 
+if TYPE_CHECKING:
+    from ...cell import Cell
+    from ...cell_change_info import CellChanges
+
 
 class EncloseFullGarden(SolverRule):
     def apply_rule(self) -> CellChanges:
-        """If there is a complete garden, enclose it with walls."""
-        cell_changes = CellChanges()
+        """
+        If there is a complete garden, enclose it with walls. The cells of all the complete gardens are collected first
+        so that the walls around every one of them are found with a single row bitmask dilation.
+        """
+        full_garden_cells: list[Cell] = []
         all_gardens = self.board.get_all_gardens()
         for garden in all_gardens:
             number_of_clues = garden.get_number_of_clues()
@@ -17,14 +27,12 @@ class EncloseFullGarden(SolverRule):
             elif number_of_clues == 1:
                 clue = garden.get_clue_value()
                 if len(garden.cells) == clue:
-                    empty_adjacent_neighbors = garden.get_empty_adjacent_neighbors()
-                    for cell in empty_adjacent_neighbors:
-                        cell_changes.add_change(
-                            self.set_cell_to_state(cell, CellState.WALL, reason='Enclose full garden')
-                        )
+                    full_garden_cells.extend(garden.cells)
             else:
                 raise NoPossibleSolutionFromCurrentStateError(
                     message='Garden contains more than one clue',
                     problem_cell_groups=frozenset({garden}),
                 )
-        return cell_changes
+        return self.set_cells_to_state(
+            self.board.get_empty_adjacent_cells(full_garden_cells), CellState.WALL, reason='Enclose full garden'
+        )
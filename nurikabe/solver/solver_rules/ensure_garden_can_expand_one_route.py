@@ -1,9 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ...cell_change_info import CellChanges
-from ...cell_group import CellGroup
 from ...cell_state import CellState
 from ..board_state_checker import NoPossibleSolutionFromCurrentStateError
 from .abstract_solver_rule import SolverRule
 
+if TYPE_CHECKING:
+    from ...cell import Cell
+    from ...cell_group import CellGroup
+
 
 class EnsureGardenCanExpandOneRoute(SolverRule):
     # TODO: this is definitely covered by the combo of EnsureGardenWithClueCanExpand and
@@ -17,31 +24,37 @@ class EnsureGardenCanExpandOneRoute(SolverRule):
         that cell, so mark that cell as part of the garden.
         """
         cell_changes = CellChanges()
+        changed_cells: set[Cell] = set()
         all_gardens = self.board.get_all_gardens()
         for garden in all_gardens:
+            if garden.is_adjacent_to_any_cell(changed_cells):
+                # This garden has joined up with a cell that was just marked as a non-wall, so it is out of date. It is
+                # left for the next pass once the gardens are found again.
+                continue
             number_of_clues = garden.get_number_of_clues()
             if number_of_clues == 0:
-                cell_changes.add_changes(self.handle_undersized_garden_escape_routes(garden))
+                cell_changes.add_changes(self.handle_undersized_garden_escape_routes(garden, changed_cells))
             elif number_of_clues == 1:
                 clue = garden.get_clue_value()
                 if len(garden.cells) < clue:
-                    cell_changes.add_changes(self.handle_undersized_garden_escape_routes(garden))
+                    cell_changes.add_changes(self.handle_undersized_garden_escape_routes(garden, changed_cells))
             else:
                 raise NoPossibleSolutionFromCurrentStateError(
                     message='Garden contains more than one clue',
                     problem_cell_groups=frozenset({garden}),
                 )
-            if cell_changes.has_any_changes():
-                # Since some cells were marked as non-walls, the previously calculated all_gardens is no longer valid
-                return cell_changes
         return cell_changes
 
-    def handle_undersized_garden_escape_routes(self, non_wall_cell_group: CellGroup) -> CellChanges:
+    def handle_undersized_garden_escape_routes(
+        self, non_wall_cell_group: CellGroup, changed_cells: set[Cell]
+    ) -> CellChanges:
         cell_changes = CellChanges()
-        escape_route_cells = non_wall_cell_group.get_empty_adjacent_neighbors()
+        # Only need to know if there is exactly one escape route
+        escape_route_cells = non_wall_cell_group.get_empty_adjacent_neighbors_up_to(limit=2)
         if len(escape_route_cells) == 1:
-            only_escape_route_cell = next(iter(escape_route_cells))
+            only_escape_route_cell = escape_route_cells[0]
             cell_changes.add_change(
                 self.set_cell_to_state(only_escape_route_cell, CellState.NON_WALL, reason='Ensure garden can expand')
             )
+            changed_cells.add(only_escape_route_cell)
         return cell_changes
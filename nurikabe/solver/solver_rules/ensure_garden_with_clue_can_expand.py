@@ -20,9 +20,11 @@ class EnsureGardenWithClueCanExpand(SolverRule):
         incomplete_gardens_with_clue = {garden for garden in gardens_with_clue if not garden.is_garden_correct_size()}
 
         cell_changes = CellChanges()
+        wall_cells = self.board.get_wall_cells()
 
         for incomplete_garden_with_clue in incomplete_gardens_with_clue:
             off_limit_cells = self.get_off_limit_cells(
+                wall_cells=wall_cells,
                 gardens_with_clue=gardens_with_clue,
                 this_garden=incomplete_garden_with_clue,
             )
@@ -50,18 +52,17 @@ class EnsureGardenWithClueCanExpand(SolverRule):
             escape_route_cells = {cell for cell in escape_route_cells if cell.cell_state.is_empty()}
 
             # Additionally, filter to only include cells that are Manhattan reachable from the
-            # incomplete_garden_with_clue
+            # incomplete_garden_with_clue. The distances are computed once and reused for the prioritization below.
             remaining_garden_size = incomplete_garden_with_clue.get_num_of_remaining_garden_cells()
-            escape_route_cells = {
-                cell
-                for cell in escape_route_cells
-                if incomplete_garden_with_clue.get_shortest_manhattan_distance_to_cell(cell) <= remaining_garden_size
+            escape_route_cell_distances = {
+                cell: distance
+                for cell, distance in incomplete_garden_with_clue.get_shortest_manhattan_distance_to_cells(
+                    escape_route_cells
+                ).items()
+                if distance <= remaining_garden_size
             }
 
-            prioritized_escape_route_cells = self.get_prioritized_escape_route_cells(
-                escape_route_cells=escape_route_cells,
-                source_garden=incomplete_garden_with_clue,
-            )
+            prioritized_escape_route_cells = self.get_prioritized_escape_route_cells(escape_route_cell_distances)
 
             for escape_route_cell in prioritized_escape_route_cells:
                 # If the escape_route_cell were to be marked as a wall, would the incomplete_garden_with_clue be able to
@@ -88,17 +89,17 @@ class EnsureGardenWithClueCanExpand(SolverRule):
         return cell_changes
 
     @staticmethod
-    def get_prioritized_escape_route_cells(escape_route_cells: set[Cell], source_garden: Garden) -> list[Cell]:
+    def get_prioritized_escape_route_cells(escape_route_cell_distances: dict[Cell, int]) -> list[Cell]:
         """
         Set the order in which to check the escape route cells. In a somewhat hand wavy way, we think that cells
-        closer to the source_garden are more likely to be critical, so prioritize based on distance to the
-        source_garden.
+        closer to the source garden are more likely to be critical, so prioritize based on distance to the source
+        garden. escape_route_cell_distances maps each escape route cell to that distance.
         """
-        return sorted(escape_route_cells, key=lambda cell: source_garden.get_shortest_manhattan_distance_to_cell(cell))
+        return sorted(escape_route_cell_distances, key=escape_route_cell_distances.__getitem__)
 
-    def get_off_limit_cells(self, gardens_with_clue: set[Garden], this_garden: Garden) -> set[Cell]:
-        off_limit_cells: set[Cell] = set()
-        off_limit_cells.update(self.board.get_wall_cells())
+    @staticmethod
+    def get_off_limit_cells(wall_cells: set[Cell], gardens_with_clue: set[Garden], this_garden: Garden) -> set[Cell]:
+        off_limit_cells = set(wall_cells)
 
         other_gardens_with_clue = gardens_with_clue - {this_garden}
         for garden in other_gardens_with_clue:
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from ...board import Board
@@ -17,15 +18,22 @@ class PathToGardenInfo:
 
 
 class EnsureGardenWithoutClueCanExpand(SolverRule):
+    # If True, every cell found to be a non-wall is marked in a single call. Otherwise, return after the first one.
+    SHOULD_EMIT_ALL_NON_WALL_CELLS = True
+
     def apply_rule(self) -> CellChanges:
         """
         If there is an incomplete garden without a clue and marking an empty cell as a wall would make it so that the
         garden would not be able to expand to reach a clue cell, that empty cell cannot be a wall, so mark it as a
         non-wall.
+
+        Every cell is checked against the board state from the start of the call, and the changes are only applied at
+        the end. Each such deduction holds on its own, so marking one of these cells as a non-wall never invalidates
+        another.
         """
         garden_info = GardenInfo(self.board)
 
-        cell_changes = CellChanges()
+        non_wall_cells: list[Cell] = []
 
         for garden_without_clue in garden_info.gardens_without_clue:
             # Get the set of gardens that are incomplete, have a clue, and are reachable from this garden_without_clue.
@@ -48,21 +56,17 @@ class EnsureGardenWithoutClueCanExpand(SolverRule):
             # Extract the set of empty cells that are in all the paths the reachable incomplete gardens with a clue.
             # These are the only possible cells that, if they were a wall, have the potential to block every path to the
             # aforementioned gardens.
-            cells_in_all_paths: set[Cell] = set.intersection(
-                *[
-                    set(reachable_garden_and_path.path_cell_tuple)
-                    for reachable_garden_and_path in reachable_gardens_and_path
-                ],
-            )
-            empty_cells_in_all_paths = {cell for cell in cells_in_all_paths if cell.cell_state.is_empty()}
+            empty_cells_in_all_paths = self.get_empty_cells_in_all_paths(reachable_gardens_and_path)
 
             # Each of the cells above have the *potential* to block every path to the aforementioned gardens. We'll need
             # to check each cell one-by-one. Set the order in which to check the cells. In a somewhat hand wavy way, we
             # think that cells closer to the garden_without_clue are more likely to be critical to all paths, so
             # prioritize based on distance to the garden_without_clue.
+            escape_route_cell_distances = garden_without_clue.get_shortest_manhattan_distance_to_cells(
+                empty_cells_in_all_paths
+            )
             prioritized_escape_route_cells = sorted(
-                empty_cells_in_all_paths,
-                key=lambda cell: garden_without_clue.get_shortest_manhattan_distance_to_cell(cell),
+                escape_route_cell_distances, key=escape_route_cell_distances.__getitem__
             )
             for escape_route_cell in prioritized_escape_route_cells:
                 # TODO: also filter via flood fill?
@@ -75,19 +79,33 @@ class EnsureGardenWithoutClueCanExpand(SolverRule):
                     gardens_to_check=reachable_gardens,
                     additional_off_limit_cell=escape_route_cell,
                 )
-                if not is_any_garden_reachable:
-                    cell_changes.add_change(
-                        self.set_cell_to_state(
-                            escape_route_cell,
-                            CellState.NON_WALL,
-                            reason='Ensure garden without clue can reach a clue cell',
-                        )
-                    )
+                if not is_any_garden_reachable and escape_route_cell not in non_wall_cells:
+                    non_wall_cells.append(escape_route_cell)
+                    if not self.SHOULD_EMIT_ALL_NON_WALL_CELLS:
+                        return self.set_cells_to_non_wall(non_wall_cells)
+        return self.set_cells_to_non_wall(non_wall_cells)
 
-                    # Since some cells were marked as non-walls, the previously calculated all_gardens is no longer
-                    # valid
-                    return cell_changes
-        return cell_changes
+    def set_cells_to_non_wall(self, non_wall_cells: list[Cell]) -> CellChanges:
+        return self.set_cells_to_state(
+            non_wall_cells, CellState.NON_WALL, reason='Ensure garden without clue can reach a clue cell'
+        )
+
+    @staticmethod
+    def get_empty_cells_in_all_paths(reachable_gardens_and_path: set[PathToGardenInfo]) -> set[Cell]:
+        """
+        Intersect the paths starting from the shortest one. The shortest path gives the smallest starting set, and the
+        intersection can stop as soon as it becomes empty.
+        """
+        paths = sorted(
+            (reachable_garden_and_path.path_cell_tuple for reachable_garden_and_path in reachable_gardens_and_path),
+            key=len,
+        )
+        empty_cells_in_all_paths = {cell for cell in paths[0] if cell.cell_state.is_empty()}
+        for path in paths[1:]:
+            if len(empty_cells_in_all_paths) == 0:
+                break
+            empty_cells_in_all_paths.intersection_update(path)
+        return empty_cells_in_all_paths
 
 
 class GardenInfo:
@@ -106,6 +124,17 @@ class GardenInfo:
         self.complete_gardens = self.all_gardens - self.incomplete_gardens
         self.wall_cells = self.board.get_wall_cells()
 
+        # Every path search needs the cells adjacent to all but one of the gardens with a clue, so the adjacent cells
+        # of each garden with a clue are found once up front
+        self.garden_with_clue_adjacent_neighbors = [
+            (garden, garden.get_adjacent_neighbors()) for garden in self.gardens_with_clue
+        ]
+
+        # The flood fill off limit cells only differ by the additional off limit cell, so the shared part is built once
+        self.flood_fill_off_limit_cells = frozenset(
+            self.get_off_limit_cells(adjacent_off_limit_gardens=self.complete_gardens)
+        )
+
     def get_reachable_gardens_and_path(
         self, source_garden_without_clue: Garden, additional_off_limit_cell: Cell | None = None
     ) -> set[PathToGardenInfo]:
@@ -154,13 +183,10 @@ class GardenInfo:
         Get the cells that can be accessed from the source_garden_without_clue without going through an off limit cell.
         Off limit cells are wall cells and any cell adjacent to a complete garden.
         """
-        off_limit_cells = self.get_off_limit_cells(
-            adjacent_off_limit_gardens=self.complete_gardens,
-            additional_off_limit_cell=additional_off_limit_cell,
-        )
+        off_limit_cells = self.flood_fill_off_limit_cells
         return self.board.get_connected_cells(
             starting_cell=next(iter(source_garden_without_clue.cells)),
-            cell_criteria_func=lambda cell: cell not in off_limit_cells,
+            cell_criteria_func=lambda cell: cell is not additional_off_limit_cell and cell not in off_limit_cells,
         )
 
     def get_manhattan_reachable_incomplete_gardens_with_clue(self, source_garden_without_clue: Garden) -> set[Garden]:
@@ -211,9 +237,8 @@ class GardenInfo:
     ) -> list[Cell]:
         """Find the (shortest) path from the source_garden_without_clue to the destination_garden_with_clue."""
         other_gardens_without_clue = self.gardens_without_clue - {source_garden_without_clue}
-        other_gardens_with_clue = self.gardens_with_clue - {destination_garden_with_clue}
-        off_limit_cells = self.get_off_limit_cells(
-            adjacent_off_limit_gardens=other_gardens_with_clue,
+        off_limit_cells = self.get_path_off_limit_cells(
+            destination_garden_with_clue=destination_garden_with_clue,
             additional_off_limit_cell=additional_off_limit_cell,
         )
         path_finder = PathFinder(
@@ -230,10 +255,27 @@ class GardenInfo:
         # Add two since the path length includes both the starting and ending cell
         remaining_available_path_length = remaining_available_cells + 2
         path_info = path_finder.get_path_info(max_path_length=remaining_available_path_length)
-        return path_info.cell_list
+        return path_info.get_cell_list()
+
+    def get_path_off_limit_cells(
+        self, destination_garden_with_clue: Garden, additional_off_limit_cell: Cell | None = None
+    ) -> set[Cell]:
+        """
+        Get the cells that a path to the destination_garden_with_clue cannot go through. These are the wall cells, the
+        cells adjacent to any other garden with a clue and the additional_off_limit_cell if given.
+        """
+        off_limit_cells = set(self.wall_cells)
+        for garden, adjacent_neighbors in self.garden_with_clue_adjacent_neighbors:
+            if garden is not destination_garden_with_clue:
+                off_limit_cells.update(adjacent_neighbors)
+
+        if additional_off_limit_cell is not None:
+            off_limit_cells.add(additional_off_limit_cell)
+
+        return off_limit_cells
 
     def get_off_limit_cells(
-        self, adjacent_off_limit_gardens: set[Garden], additional_off_limit_cell: Cell | None = None
+        self, adjacent_off_limit_gardens: Iterable[Garden], additional_off_limit_cell: Cell | None = None
     ) -> set[Cell]:
         off_limit_cells: set[Cell] = set()
         off_limit_cells.update(self.wall_cells)
@@ -6,31 +6,50 @@ from .abstract_solver_rule import SolverRule
 
 
 class EnsureNoTwoByTwoWalls(SolverRule):
-    CELL_COUNT_IN_TWO_BY_TWO_SECTION = 4
-
     def apply_rule(self) -> CellChanges:
         """
         If marking an empty cell as a wall would create a two-by-two section of walls, then that cell must be a
         non-wall. We define a cell as being the start of a two-by-two section of walls if it is the top-left cell in the
         group of walls. Because of this, we don't bother checking any cell in the bottom row or the right most column
         since it cannot be the start of a two-by-two group of walls.
+
+        Each pair of adjacent rows is checked at once using the row bitmasks of the wall and empty cells. Shifting a
+        row's bitmask right by one lines up each cell with its right neighbor, so bit i of the combined masks below
+        describes the two-by-two section whose top-left cell is in column i. The empty cells to mark are collected into
+        row bitmasks and set all at once at the end.
         """
-        cell_changes = CellChanges()
-        for row in self.board.cell_grid[:-1]:
-            for cell in row[:-1]:
-                two_by_two_section = cell.get_two_by_two_section()
-                two_by_two_section_num_of_walls = len(
-                    [cell for cell in two_by_two_section if cell.cell_state.is_wall()]
+        wall_bits = self.board.state_bits[CellState.WALL]
+        empty_bits = self.board.state_bits[CellState.EMPTY]
+        non_wall_row_bits = [0] * self.board.level.number_of_rows
+        for row_number in range(self.board.level.number_of_rows - 1):
+            top_left_wall = wall_bits[row_number]
+            top_right_wall = top_left_wall >> 1
+            bottom_left_wall = wall_bits[row_number + 1]
+            bottom_right_wall = bottom_left_wall >> 1
+
+            four_walls = top_left_wall & top_right_wall & bottom_left_wall & bottom_right_wall
+            if four_walls:
+                top_left_cell = next(self.board.get_cells_from_row_bits(row_number, four_walls))
+                raise NoPossibleSolutionFromCurrentStateError(
+                    message='There is a two-by-two section of walls',
+                    problem_cell_groups=frozenset({CellGroup(top_left_cell.get_two_by_two_section())}),
                 )
-                if two_by_two_section_num_of_walls == self.CELL_COUNT_IN_TWO_BY_TWO_SECTION - 1:
-                    for cell_corner in two_by_two_section:
-                        if cell_corner.cell_state.is_empty():
-                            cell_changes.add_change(
-                                self.set_cell_to_state(cell_corner, CellState.NON_WALL, reason='No two-by-two walls')
-                            )
-                elif two_by_two_section_num_of_walls == self.CELL_COUNT_IN_TWO_BY_TWO_SECTION:
-                    raise NoPossibleSolutionFromCurrentStateError(
-                        message='There is a two-by-two section of walls',
-                        problem_cell_groups=frozenset({CellGroup(two_by_two_section)}),
-                    )
-        return cell_changes
+
+            top_left_empty = empty_bits[row_number]
+            top_right_empty = top_left_empty >> 1
+            bottom_left_empty = empty_bits[row_number + 1]
+            bottom_right_empty = bottom_left_empty >> 1
+
+            # Mark the empty corner of each section with three walls. Bit i describes the section starting in column i,
+            # so the bits for the right corners are shifted by one to move them to column i + 1. Sections that share
+            # the empty cell set the same bit.
+            non_wall_row_bits[row_number] |= (
+                top_left_empty & top_right_wall & bottom_left_wall & bottom_right_wall
+            ) | ((top_left_wall & top_right_empty & bottom_left_wall & bottom_right_wall) << 1)
+            non_wall_row_bits[row_number + 1] |= (
+                top_left_wall & top_right_wall & bottom_left_empty & bottom_right_wall
+            ) | ((top_left_wall & top_right_wall & bottom_left_wall & bottom_right_empty) << 1)
+
+        return self.set_cells_to_state(
+            self.board.get_cells_from_all_row_bits(non_wall_row_bits), CellState.NON_WALL, reason='No two-by-two walls'
+        )
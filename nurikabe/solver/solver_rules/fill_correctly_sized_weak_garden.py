@@ -1,7 +1,12 @@
+from typing import TYPE_CHECKING
+
 from ...cell_change_info import CellChanges
 from ...cell_state import CellState
 from .abstract_solver_rule import SolverRule
 
+if TYPE_CHECKING:
+    from ...cell import Cell
+
 
 class FillCorrectlySizedWeakGarden(SolverRule):
     def apply_rule(self) -> CellChanges:
@@ -11,10 +16,22 @@ class FillCorrectlySizedWeakGarden(SolverRule):
         cell_changes = CellChanges()
         all_weak_gardens = self.board.get_all_weak_gardens()
         for weak_garden in all_weak_gardens:
-            if weak_garden.does_have_exactly_one_clue() and weak_garden.is_garden_correct_size():
-                empty_cells = {cell for cell in weak_garden.cells if cell.cell_state.is_empty()}
-                for cell in empty_cells:
-                    cell_changes.add_change(
-                        self.set_cell_to_state(cell, CellState.NON_WALL, reason='Fill completed weak garden')
-                    )
+            # Gather the clue cells and the empty cells in a single pass over the weak garden instead of separately
+            # counting the clues, looking up the clue value and filtering for the empty cells
+            clue_cells: list[Cell] = []
+            empty_cells: list[Cell] = []
+            for cell in weak_garden.cells:
+                if cell.has_clue:
+                    clue_cells.append(cell)
+                elif cell.cell_state.is_empty():
+                    empty_cells.append(cell)
+
+            if (
+                len(clue_cells) == 1
+                and len(empty_cells) > 0
+                and len(weak_garden.cells) == clue_cells[0].get_non_null_clue()
+            ):
+                cell_changes.add_changes(
+                    self.set_cells_to_state(empty_cells, CellState.NON_WALL, reason='Fill completed weak garden')
+                )
         return cell_changes
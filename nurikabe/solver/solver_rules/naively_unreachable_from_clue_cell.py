@@ -1,25 +1,48 @@
+from ...board import Board
 from ...cell_change_info import CellChanges
 from ...cell_state import CellState
 from .abstract_solver_rule import SolverRule
 
 
 class NaivelyUnreachableFromClueCell(SolverRule):
+    def __init__(self, board: Board):
+        super().__init__(board)
+
+        # Clue cells never change, so the cells that are naively reachable from a clue cell can be found once up front
+        self.clue_reachable_row_bits = self.get_clue_reachable_row_bits()
+
     def apply_rule(self) -> CellChanges:
         """
         If there are any empty cells that are naively unreachable by a clue cell, it must be a wall. Here, naively means
         using the Manhattan distance between cells ignoring the fact that the path between the cells may not be allowed.
         This is a much cheaper check compared to proper path finding algorithms.
         """
-        cell_changes = CellChanges()
-        clue_cells = self.board.get_clue_cells()
-        for cell in self.board.get_empty_cells():
-            is_cell_reachable_by_a_clue = False
-            for clue_cell in clue_cells:
-                if cell.get_shortest_naive_path_length(clue_cell) <= clue_cell.get_non_null_clue():
-                    is_cell_reachable_by_a_clue = True
-                    break
-            if not is_cell_reachable_by_a_clue:
-                cell_changes.add_change(
-                    self.set_cell_to_state(cell, CellState.WALL, reason='Not Manhattan reachable by any clue cells')
+        empty_row_bits = self.board.state_bits[CellState.EMPTY]
+        unreachable_row_bits = [
+            empty_bits & ~reachable_bits
+            for empty_bits, reachable_bits in zip(empty_row_bits, self.clue_reachable_row_bits, strict=True)
+        ]
+        return self.set_cells_to_state(
+            self.board.get_cells_from_all_row_bits(unreachable_row_bits),
+            CellState.WALL,
+            reason='Not Manhattan reachable by any clue cells',
+        )
+
+    def get_clue_reachable_row_bits(self) -> list[int]:
+        """
+        Get the row bitmasks of the cells that are naively reachable from any clue cell. A path from a clue cell
+        includes the clue cell itself, so a cell is reachable if its Manhattan distance to the clue cell is less than
+        the clue.
+        """
+        clue_reachable_row_bits = [0] * self.board.level.number_of_rows
+        for clue_cell in self.board.get_clue_cells():
+            within_distance_row_bits = self.board.get_row_bits_within_distance(
+                clue_cell, clue_cell.get_non_null_clue() - 1
+            )
+            clue_reachable_row_bits = [
+                reachable_bits | within_distance_bits
+                for reachable_bits, within_distance_bits in zip(
+                    clue_reachable_row_bits, within_distance_row_bits, strict=True
                 )
-        return cell_changes
+            ]
+        return clue_reachable_row_bits
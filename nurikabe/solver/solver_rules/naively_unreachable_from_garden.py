@@ -9,23 +9,28 @@ class NaivelyUnreachableFromGarden(SolverRule):
         If there are any empty cells that are naively unreachable by a garden, it must be a wall. Here, naively means
         using the Manhattan distance between cells ignoring the fact that the path between the cells may not be
         allowed. This checks if cells are reachable from a garden in the remaining number of missing non-wall cells
-        for that garden.
+        for that garden. The cells within reach of each garden are found by expanding the garden's row bitmasks one step
+        at a time.
         """
-        cell_changes = CellChanges()
-        incomplete_gardens = self.get_incomplete_gardens(with_clue_only=True)
-        incomplete_gardens_and_remaining_sizes = [
-            (incomplete_garden, incomplete_garden.get_num_of_remaining_garden_cells())
-            for incomplete_garden in incomplete_gardens
-        ]
-
-        for cell in self.board.get_empty_cells():
-            is_cell_reachable_by_a_clue = False
-            for incomplete_garden, remaining_garden_size in incomplete_gardens_and_remaining_sizes:
-                if incomplete_garden.get_shortest_manhattan_distance_to_cell(cell) <= remaining_garden_size:
-                    is_cell_reachable_by_a_clue = True
-                    break
-            if not is_cell_reachable_by_a_clue:
-                cell_changes.add_change(
-                    self.set_cell_to_state(cell, CellState.WALL, reason='Not Manhattan reachable by any gardens')
+        reachable_row_bits = [0] * self.board.level.number_of_rows
+        for incomplete_garden in self.get_incomplete_gardens(with_clue_only=True):
+            garden_reachable_row_bits = self.board.get_expanded_row_bits(
+                self.board.get_row_bits(incomplete_garden.cells), incomplete_garden.get_num_of_remaining_garden_cells()
+            )
+            reachable_row_bits = [
+                reachable_bits | garden_reachable_bits
+                for reachable_bits, garden_reachable_bits in zip(
+                    reachable_row_bits, garden_reachable_row_bits, strict=True
                 )
-        return cell_changes
+            ]
+
+        empty_row_bits = self.board.state_bits[CellState.EMPTY]
+        unreachable_row_bits = [
+            empty_bits & ~reachable_bits
+            for empty_bits, reachable_bits in zip(empty_row_bits, reachable_row_bits, strict=True)
+        ]
+        return self.set_cells_to_state(
+            self.board.get_cells_from_all_row_bits(unreachable_row_bits),
+            CellState.WALL,
+            reason='Not Manhattan reachable by any gardens',
+        )
@@ -1,4 +1,6 @@
+from ...cell import Cell
 from ...cell_change_info import CellChanges
+from ...cell_group import CellGroup
 from ...cell_state import CellState
 from ..board_state_checker import BoardStateChecker
 from .abstract_solver_rule import SolverRule
@@ -12,6 +14,10 @@ class NoIsolatedWallSections(SolverRule):
         more expensive, but also more comprehensive than NoIsolatedWallSectionsNaive.
         """
         cell_changes = CellChanges()
+        if len(self.board.get_all_wall_sections()) <= 1:
+            # The walls are already connected, so no empty cell can separate them
+            return cell_changes
+
         non_garden_cell_groups_with_walls = self.board.get_all_non_garden_cell_groups_with_walls()
         if len(non_garden_cell_groups_with_walls) == 0:
             return cell_changes
@@ -19,15 +25,92 @@ class NoIsolatedWallSections(SolverRule):
         board_state_checker = BoardStateChecker(self.board)
         board_state_checker.check_for_isolated_walls(non_garden_cell_groups_with_walls)
 
-        for cell in self.board.get_empty_cells():
-            cell_groups = self.board.get_all_non_garden_cell_groups_with_walls(additional_off_limit_cell=cell)
-            if len(cell_groups) > 1:
-                cell_changes.add_change(
-                    self.set_cell_to_state(
-                        cell,
-                        CellState.WALL,
-                        reason='Ensure no isolated wall sections',
-                    ),
+        # At this point, all the walls are in a single non-garden cell group
+        non_garden_cell_group_with_walls = next(iter(non_garden_cell_groups_with_walls))
+        wall_separating_cells = self.get_wall_separating_cells(non_garden_cell_group_with_walls)
+        return self.set_cells_to_state(
+            (cell for cell in self.board.flat_cell_list if cell in wall_separating_cells),
+            CellState.WALL,
+            reason='Ensure no isolated wall sections',
+        )
+
+    def get_wall_separating_cells(self, non_garden_cell_group: CellGroup) -> set[Cell]:
+        """
+        Get the empty cells in the non_garden_cell_group that, if removed, would split the cell group into multiple
+        parts that each contain a wall.
+
+        This uses a single (iterative) depth first search to find the articulation points of the cell group, starting
+        from a wall cell. When a cell is removed, the subtree under one of its children is cut off from the rest of the
+        cell group if no cell in that subtree links back above the removed cell. The rest of the cell group always
+        contains the starting wall cell, so the removed cell separates walls if any cut off subtree contains a wall.
+
+        The search state is kept in flat lists indexed by each cell's position in the board's flat_cell_list rather
+        than in dicts keyed by Cell, which avoids calling Cell.__hash__ for every lookup.
+        """
+        flat_cell_list = self.board.flat_cell_list
+        number_of_cells = len(flat_cell_list)
+        cell_group_neighbor_indexes = self.get_cell_group_neighbor_indexes(non_garden_cell_group)
+
+        starting_cell = next(cell for cell in non_garden_cell_group.cells if cell.cell_state.is_wall())
+        starting_index = starting_cell.flat_index
+
+        discovery_order = [-1] * number_of_cells
+        lowest_reachable_order = [-1] * number_of_cells
+        does_subtree_contain_wall = [False] * number_of_cells
+        discovery_order[starting_index] = lowest_reachable_order[starting_index] = 0
+        does_subtree_contain_wall[starting_index] = True
+        number_of_discovered_cells = 1
+        wall_separating_cells: set[Cell] = set()
+
+        stack = [(starting_index, iter(cell_group_neighbor_indexes[starting_index]))]
+        while stack:
+            cell_index, neighbor_index_iterator = stack[-1]
+            for neighbor_index in neighbor_index_iterator:
+                if discovery_order[neighbor_index] < 0:
+                    discovery_order[neighbor_index] = number_of_discovered_cells
+                    lowest_reachable_order[neighbor_index] = number_of_discovered_cells
+                    number_of_discovered_cells += 1
+                    does_subtree_contain_wall[neighbor_index] = flat_cell_list[neighbor_index].cell_state.is_wall()
+                    stack.append((neighbor_index, iter(cell_group_neighbor_indexes[neighbor_index])))
+                    break
+                lowest_reachable_order[cell_index] = min(
+                    lowest_reachable_order[cell_index], discovery_order[neighbor_index]
                 )
+            else:
+                # All neighbors of this cell have been visited, so pass its results up to its parent
+                stack.pop()
+                if not stack:
+                    break
+                parent_index = stack[-1][0]
+                lowest_reachable_order[parent_index] = min(
+                    lowest_reachable_order[parent_index], lowest_reachable_order[cell_index]
+                )
+                if does_subtree_contain_wall[cell_index]:
+                    does_subtree_contain_wall[parent_index] = True
+                    parent_cell = flat_cell_list[parent_index]
+                    if (
+                        lowest_reachable_order[cell_index] >= discovery_order[parent_index]
+                        and parent_cell.cell_state.is_empty()
+                    ):
+                        wall_separating_cells.add(parent_cell)
+
+        return wall_separating_cells
+
+    def get_cell_group_neighbor_indexes(self, cell_group: CellGroup) -> list[list[int]]:
+        """
+        For each cell in the cell_group, get the flat indexes of its adjacent neighbors that are also in the cell_group.
+        The list is indexed by flat index and is empty for cells outside of the cell_group.
+        """
+        cell_group_flat_indexes = [cell.flat_index for cell in cell_group.cells]
+        is_in_cell_group = [False] * len(self.board.flat_cell_list)
+        for flat_index in cell_group_flat_indexes:
+            is_in_cell_group[flat_index] = True
 
-        return cell_changes
+        cell_group_neighbor_indexes: list[list[int]] = [[] for _ in self.board.flat_cell_list]
+        for flat_index in cell_group_flat_indexes:
+            cell_group_neighbor_indexes[flat_index] = [
+                neighbor_index
+                for neighbor_index in self.board.adjacent_flat_indexes[flat_index]
+                if is_in_cell_group[neighbor_index]
+            ]
+        return cell_group_neighbor_indexes
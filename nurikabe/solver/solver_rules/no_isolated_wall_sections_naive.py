@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ...cell_change_info import CellChanges
 from ...cell_state import CellState
 from ..board_state_checker import NoPossibleSolutionFromCurrentStateError
 from .abstract_solver_rule import SolverRule
 
+if TYPE_CHECKING:
+    from ...cell import Cell
+    from ...wall_section import WallSection
+
 
 class NoIsolatedWallSectionsNaive(SolverRule):
     def apply_rule(self) -> CellChanges:
@@ -19,20 +27,40 @@ class NoIsolatedWallSectionsNaive(SolverRule):
             # If there is one wall section, then we don't know that the wall section needs to expand
             return cell_changes
 
+        changed_cells: set[Cell] = set()
         for wall_section in wall_sections:
-            escape_routes = wall_section.get_empty_adjacent_neighbors()
+            if wall_section.is_adjacent_to_any_cell(changed_cells):
+                # This wall section has joined up with a wall section that was already extended as far as it could be
+                continue
+            cell_changes.add_changes(self.extend_through_only_escape_routes(wall_section, changed_cells))
+        return cell_changes
+
+    def extend_through_only_escape_routes(self, wall_section: WallSection, changed_cells: set[Cell]) -> CellChanges:
+        """
+        While the wall section has only one escape route, set that escape route cell to a wall. The wall section that it
+        becomes part of is found with a flood fill from that cell, which only visits the grown wall section rather than
+        the whole board. This stops once the wall section has more than one escape route or contains all the walls.
+        """
+        cell_changes = CellChanges()
+        while True:
+            # Only need to know if there are zero, one or more escape routes
+            escape_routes = wall_section.get_empty_adjacent_neighbors_up_to(limit=2)
             if len(escape_routes) == 0:
                 raise NoPossibleSolutionFromCurrentStateError(
                     message='Isolated wall section',
                     problem_cell_groups=frozenset({wall_section}),
                 )
-            if len(escape_routes) == 1:
-                only_escape_route = next(iter(escape_routes))  # Get first item in the list
-                cell_changes.add_change(
-                    self.set_cell_to_state(
-                        only_escape_route, CellState.WALL, reason='Ensure no naively isolated wall sections'
-                    )
+            if len(escape_routes) > 1:
+                return cell_changes
+
+            only_escape_route = escape_routes[0]
+            cell_changes.add_change(
+                self.set_cell_to_state(
+                    only_escape_route, CellState.WALL, reason='Ensure no naively isolated wall sections'
                 )
-                # Because a cell was changed to a wall, the previously calculated wall_sections is no longer valid
+            )
+            changed_cells.add(only_escape_route)
+            wall_section = self.board.get_wall_section(only_escape_route)
+            if len(wall_section.cells) == len(self.board.cells_by_state[CellState.WALL]):
+                # All the walls are now in one wall section, so we don't know that the wall section needs to expand
                 return cell_changes
-        return cell_changes
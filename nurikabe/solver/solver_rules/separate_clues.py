@@ -1,16 +1,49 @@
+from ...board import Board
 from ...cell_change_info import CellChanges
 from ...cell_state import CellState
 from .abstract_solver_rule import SolverRule
 
 
 class SeparateClues(SolverRule):
+    def __init__(self, board: Board):
+        super().__init__(board)
+
+        # Clue cells never change, so the cells adjacent to more than one clue cell can be found once up front
+        self.multiple_clue_neighbors_row_bits = self.get_multiple_clue_neighbors_row_bits()
+
     def apply_rule(self) -> CellChanges:
         """
         A cell must be a wall if it is adjacent (non-diagonally) to more than one cell with a clue since gardens cannot
         have more than one clue.
         """
-        cell_changes = CellChanges()
-        for cell in self.board.get_empty_cells():
-            if len([cell for adjacent_cell in cell.get_adjacent_neighbors() if adjacent_cell.has_clue]) > 1:
-                cell_changes.add_change(self.set_cell_to_state(cell, CellState.WALL, reason='separate clues'))
-        return cell_changes
+        empty_row_bits = self.board.state_bits[CellState.EMPTY]
+        wall_row_bits = [
+            row_bits & empty_bits
+            for row_bits, empty_bits in zip(self.multiple_clue_neighbors_row_bits, empty_row_bits, strict=True)
+        ]
+        return self.set_cells_to_state(
+            self.board.get_cells_from_all_row_bits(wall_row_bits), CellState.WALL, reason='separate clues'
+        )
+
+    def get_multiple_clue_neighbors_row_bits(self) -> list[int]:
+        """
+        Get the row bitmasks of the cells that are adjacent (non-diagonally) to more than one cell with a clue. Rather
+        than counting the clue neighbors of each cell, the clue row bitmasks are shifted so that each direction gives
+        the cells with a clue neighbor in that direction. A cell has at least two clue neighbors if it has one on both
+        sides horizontally, one on both sides vertically, or one horizontally and one vertically.
+        """
+        clue_row_bits = self.board.state_bits[CellState.CLUE]
+        full_row_bits = (1 << self.board.level.number_of_columns) - 1
+        last_row_number = self.board.level.number_of_rows - 1
+        multiple_clue_neighbors_row_bits = []
+        for row_number, row_bits in enumerate(clue_row_bits):
+            clue_on_left = (row_bits << 1) & full_row_bits
+            clue_on_right = row_bits >> 1
+            clue_above = clue_row_bits[row_number - 1] if row_number > 0 else 0
+            clue_below = clue_row_bits[row_number + 1] if row_number < last_row_number else 0
+            multiple_clue_neighbors_row_bits.append(
+                (clue_on_left & clue_on_right)
+                | (clue_above & clue_below)
+                | ((clue_on_left | clue_on_right) & (clue_above | clue_below))
+            )
+        return multiple_clue_neighbors_row_bits
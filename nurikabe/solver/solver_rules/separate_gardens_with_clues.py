@@ -1,25 +1,34 @@
-from typing import TYPE_CHECKING
-
 from ...cell_change_info import CellChanges
 from ...cell_state import CellState
 from .abstract_solver_rule import SolverRule
 
-if TYPE_CHECKING:
-    from ...cell import Cell
-
 
 class SeparateGardensWithClues(SolverRule):
     def apply_rule(self) -> CellChanges:
         """If a cell is adjacent to more than one garden containing a clue, than it must be a wall."""
-        cell_changes = CellChanges()
         incomplete_gardens = self.get_incomplete_gardens(with_clue_only=True)
-        all_empty_adjacent_cells: set[Cell] = set()
+        if len(incomplete_gardens) <= 1:
+            # No cell can be adjacent to more than one of the gardens
+            return CellChanges()
+
+        # Per row bitmasks of the cells adjacent to at least one and at least two of the incomplete gardens
+        number_of_rows = self.board.level.number_of_rows
+        adjacent_to_any_garden_row_bits = [0] * number_of_rows
+        adjacent_to_multiple_gardens_row_bits = [0] * number_of_rows
         for incomplete_garden in incomplete_gardens:
-            empty_adjacent_cells = incomplete_garden.get_empty_adjacent_neighbors()
-            for cell in empty_adjacent_cells:
-                if cell in all_empty_adjacent_cells:
-                    cell_changes.add_change(
-                        self.set_cell_to_state(cell, CellState.WALL, reason='Adjacent to multiple gardens')
-                    )
-                all_empty_adjacent_cells.add(cell)
-        return cell_changes
+            garden_row_bits = self.board.get_row_bits(incomplete_garden.cells)
+            adjacent_row_bits = self.board.get_adjacent_row_bits(garden_row_bits)
+            for row_number, row_bits in enumerate(adjacent_row_bits):
+                adjacent_to_multiple_gardens_row_bits[row_number] |= (
+                    adjacent_to_any_garden_row_bits[row_number] & row_bits
+                )
+                adjacent_to_any_garden_row_bits[row_number] |= row_bits
+
+        empty_row_bits = self.board.state_bits[CellState.EMPTY]
+        wall_row_bits = [
+            row_bits & empty_bits
+            for row_bits, empty_bits in zip(adjacent_to_multiple_gardens_row_bits, empty_row_bits, strict=True)
+        ]
+        return self.set_cells_to_state(
+            self.board.get_cells_from_all_row_bits(wall_row_bits), CellState.WALL, reason='Adjacent to multiple gardens'
+        )
@@ -1,9 +1,10 @@
+import heapq
+
 from ...cell import Cell
 from ...cell_change_info import CellChanges
 from ...cell_state import CellState
 from ...garden import Garden
 from ..board_state_checker import NoPossibleSolutionFromCurrentStateError
-from ..path_finding import NoPathFoundError, PathFinder
 from .abstract_solver_rule import SolverRule
 
 
@@ -14,71 +15,198 @@ class UnreachableFromGarden(SolverRule):
         with a clue, this detects the reachable cells. If there are empty cells that are not reachable by all gardens
         with clues, then those empty cells must be walls.
         """
-        cell_changes = CellChanges()
         all_gardens = self.board.get_all_gardens()
         gardens_with_clue = {garden for garden in all_gardens if garden.does_contain_clue()}
-        incomplete_gardens_with_clue = {garden for garden in gardens_with_clue if not garden.is_garden_correct_size()}
         gardens_without_clue = all_gardens - gardens_with_clue
+
+        # A garden with a clue and its adjacent cells are off limits to every other garden with a clue, and walls are
+        # off limits to all of them
+        ordered_gardens_with_clue = list(gardens_with_clue)
+        off_limit_row_bits_by_garden = self.get_off_limit_row_bits_by_garden(
+            wall_row_bits=self.board.state_bits[CellState.WALL],
+            garden_row_bits=[self.get_garden_and_adjacent_row_bits(garden) for garden in ordered_gardens_with_clue],
+        )
+
         all_reachable_cells: set[Cell] = set()
-        for incomplete_garden_with_clue in incomplete_gardens_with_clue:
-            other_gardens_with_clues = gardens_with_clue - {incomplete_garden_with_clue}
+        for garden, off_limit_row_bits in zip(ordered_gardens_with_clue, off_limit_row_bits_by_garden, strict=True):
+            if garden.is_garden_correct_size():
+                continue
             reachable_from_garden = self.get_cells_reachable_from_garden(
-                source_garden=incomplete_garden_with_clue,
-                other_gardens_with_clues=other_gardens_with_clues,
+                source_garden=garden,
+                off_limit_row_bits=off_limit_row_bits,
                 gardens_without_clue=gardens_without_clue,
             )
-            all_reachable_cells = all_reachable_cells.union(reachable_from_garden)
-        for cell in self.board.get_empty_cells():
-            if cell not in all_reachable_cells:
-                cell_changes.add_change(
-                    self.set_cell_to_state(
-                        cell,
-                        CellState.WALL,
-                        reason='Not reachable by any incomplete gardens with clues',
-                    ),
-                )
-                # TODO: should this return right away?
-        return cell_changes
+            all_reachable_cells.update(reachable_from_garden)
+        return self.set_cells_to_state(
+            self.board.get_empty_cells() - all_reachable_cells,
+            CellState.WALL,
+            reason='Not reachable by any incomplete gardens with clues',
+        )
+
+    @staticmethod
+    def get_off_limit_row_bits_by_garden(wall_row_bits: list[int], garden_row_bits: list[list[int]]) -> list[list[int]]:
+        """
+        For each garden, get the union of the wall row bitmasks and the row bitmasks of all the other gardens. Running
+        unions from the front and from the back of the list are built once, so each garden's union of the others is
+        a single OR of the two rather than a loop over all the other gardens.
+        """
+        if not garden_row_bits:
+            return []
+        unions_before = [list(wall_row_bits)]
+        for row_bits in garden_row_bits[:-1]:
+            unions_before.append([a | b for a, b in zip(unions_before[-1], row_bits, strict=True)])
+        unions_after = [[0] * len(wall_row_bits)]
+        for row_bits in reversed(garden_row_bits[1:]):
+            unions_after.append([a | b for a, b in zip(unions_after[-1], row_bits, strict=True)])
+        unions_after.reverse()
+        return [
+            [a | b for a, b in zip(union_before, union_after, strict=True)]
+            for union_before, union_after in zip(unions_before, unions_after, strict=True)
+        ]
+
+    def get_garden_and_adjacent_row_bits(self, garden: Garden) -> list[int]:
+        garden_row_bits = self.board.get_row_bits(garden.cells)
+        adjacent_row_bits = self.board.get_adjacent_row_bits(garden_row_bits)
+        return [
+            garden_bits | adjacent_bits
+            for garden_bits, adjacent_bits in zip(garden_row_bits, adjacent_row_bits, strict=True)
+        ]
 
     def get_cells_reachable_from_garden(
-        self, source_garden: Garden, other_gardens_with_clues: set[Garden], gardens_without_clue: set[Garden]
+        self, source_garden: Garden, off_limit_row_bits: list[int], gardens_without_clue: frozenset[Garden]
     ) -> set[Cell]:
+        """
+        Get the empty cells that the source_garden could expand to without going through any of the cells in
+        off_limit_row_bits, given the number of cells it still needs.
+        """
         if not source_garden.does_have_exactly_one_clue():
             raise NoPossibleSolutionFromCurrentStateError(
                 message='Cannot determine reach of garden since there is not exactly one clue',
                 problem_cell_groups=frozenset({source_garden}),
             )
 
-        # Determine which cells are not able to be a part of the source_garden
-        off_limit_cells = self.board.get_wall_cells()
-        for garden in other_gardens_with_clues:
-            off_limit_cells = off_limit_cells.union(garden.cells)
-            off_limit_cells = off_limit_cells.union(garden.get_adjacent_neighbors())
+        off_limit_cells = set(self.board.get_cells_from_all_row_bits(off_limit_row_bits))
 
         # Get the cells that can be accessed from source_garden without going through a cell in off_limit_cells
-        potentially_reachable_cells = self.board.get_connected_cells(
-            starting_cell=source_garden.get_clue_cell(),
-            cell_criteria_func=lambda x: x not in off_limit_cells,
+        full_row_bits = (1 << self.board.level.number_of_columns) - 1
+        potentially_reachable_row_bits = self.board.get_connected_row_bits(
+            seed_row_bits=self.board.get_row_bits([source_garden.get_clue_cell()]),
+            allowed_row_bits=[full_row_bits & ~row_bits for row_bits in off_limit_row_bits],
         )
 
         # From among the potentially reachable cells, extract the set of cells for which we want to check for
         # reachability.
         num_of_remaining_garden_cells = source_garden.get_num_of_remaining_garden_cells()
-        target_cells = potentially_reachable_cells.intersection(self.board.get_empty_cells())
-
-        # Check each target cell to determine if it is reachable
-        reachable_cells: set[Cell] = set()
-        for target_cell in target_cells:
-            try:
-                PathFinder(
-                    start_cell_group=source_garden,
-                    end_cell_group=target_cell,
-                    off_limit_cells=off_limit_cells,
-                    other_cell_groups=frozenset(gardens_without_clue),
-                ).get_path_info(max_path_length=num_of_remaining_garden_cells + 1)
-                reachable_cells.add(target_cell)
-            except NoPathFoundError:
-                # target_cell is not reachable from the source_garden
-                pass
-
-        return reachable_cells
+        empty_row_bits = self.board.state_bits[CellState.EMPTY]
+        target_cells = set(
+            self.board.get_cells_from_all_row_bits(
+                [
+                    row_bits & empty_bits
+                    for row_bits, empty_bits in zip(potentially_reachable_row_bits, empty_row_bits, strict=True)
+                ]
+            )
+        )
+
+        # A single search from the source_garden finds every cell that is within reach, rather than searching for a
+        # path to each target cell separately
+        cells_within_reach = GardenReachFinder(
+            source_garden=source_garden,
+            off_limit_cells=off_limit_cells,
+            gardens_without_clue=gardens_without_clue,
+        ).get_cells_within_reach(max_path_length=num_of_remaining_garden_cells + 1)
+        return target_cells.intersection(cells_within_reach)
+
+
+class GardenReachFinder:
+    """
+    Finds the cells that can be reached from a source garden with a path of at most a given length without going
+    through an off limit cell. The path length is measured the same way as in PathFinder: the path starts with a length
+    of one, each step to a new cell adds one, and the first time the path goes adjacent to a garden without a clue, the
+    size of that garden is added. Further steps into that garden add nothing.
+
+    Since the length of a step depends on which gardens without a clue the path has already gone adjacent to, this is a
+    uniform cost search over (cell, gardens already adjacent to) path states, with the gardens tracked as a bitmask. A
+    path state is dropped if its cell was already reached with a path that is no longer and has gone adjacent to at
+    least the same gardens. A single search finds every reachable cell, rather than searching for a path to each cell
+    separately.
+    """
+
+    def __init__(self, source_garden: Garden, off_limit_cells: set[Cell], gardens_without_clue: frozenset[Garden]):
+        self.source_garden = source_garden
+        self.off_limit_cells = off_limit_cells
+
+        self.garden_index_by_cell: dict[Cell, int] = {}
+        self.garden_sizes: list[int] = []
+        for garden_index, garden_without_clue in enumerate(gardens_without_clue):
+            self.garden_sizes.append(len(garden_without_clue.cells))
+            for cell in garden_without_clue.cells:
+                self.garden_index_by_cell[cell] = garden_index
+
+        self.adjacent_garden_bits_by_cell: dict[Cell, int] = {}
+
+    def get_cells_within_reach(self, max_path_length: int) -> set[Cell]:
+        # Every cell in the source_garden can be reached with a path length of one
+        path_states_by_cell: dict[Cell, list[tuple[int, int]]] = {cell: [(1, 0)] for cell in self.source_garden.cells}
+        path_states_to_explore = [
+            (1, 0, tie_breaker, cell) for tie_breaker, cell in enumerate(self.source_garden.cells)
+        ]
+        tie_breaker = len(path_states_to_explore)
+        while path_states_to_explore:
+            path_length, adjacent_garden_bits, _, cell = heapq.heappop(path_states_to_explore)
+            if (path_length, adjacent_garden_bits) not in path_states_by_cell[cell]:
+                # This path state was superseded by a better one after it was added
+                continue
+            for neighbor_cell in cell.get_adjacent_neighbors():
+                if neighbor_cell in self.off_limit_cells or neighbor_cell in self.source_garden.cells:
+                    continue
+                newly_adjacent_garden_bits = self.get_adjacent_garden_bits(neighbor_cell) & ~adjacent_garden_bits
+                neighbor_path_length = path_length + self.get_step_length(neighbor_cell, newly_adjacent_garden_bits)
+                if neighbor_path_length > max_path_length:
+                    continue
+                neighbor_path_state = (neighbor_path_length, adjacent_garden_bits | newly_adjacent_garden_bits)
+                neighbor_path_states = path_states_by_cell.setdefault(neighbor_cell, [])
+                if self.add_path_state(neighbor_path_states, neighbor_path_state):
+                    heapq.heappush(path_states_to_explore, (*neighbor_path_state, tie_breaker, neighbor_cell))
+                    tie_breaker += 1
+
+        return set(path_states_by_cell)
+
+    def get_adjacent_garden_bits(self, cell: Cell) -> int:
+        if cell not in self.adjacent_garden_bits_by_cell:
+            adjacent_garden_bits = 0
+            for neighbor_cell in cell.get_adjacent_neighbors():
+                if neighbor_cell in self.garden_index_by_cell:
+                    adjacent_garden_bits |= 1 << self.garden_index_by_cell[neighbor_cell]
+            self.adjacent_garden_bits_by_cell[cell] = adjacent_garden_bits
+        return self.adjacent_garden_bits_by_cell[cell]
+
+    def get_step_length(self, neighbor_cell: Cell, newly_adjacent_garden_bits: int) -> int:
+        """
+        Stepping into a garden without a clue adds nothing, and any other step adds one. The size of each garden that
+        the step newly goes adjacent to is added as well. Only the set bits are visited, so the cost does not depend on
+        the total number of gardens without a clue.
+        """
+        step_length = 0 if neighbor_cell in self.garden_index_by_cell else 1
+        while newly_adjacent_garden_bits:
+            lowest_garden_bit = newly_adjacent_garden_bits & -newly_adjacent_garden_bits
+            step_length += self.garden_sizes[lowest_garden_bit.bit_length() - 1]
+            newly_adjacent_garden_bits ^= lowest_garden_bit
+        return step_length
+
+    @staticmethod
+    def add_path_state(path_states: list[tuple[int, int]], new_path_state: tuple[int, int]) -> bool:
+        """
+        Add the new_path_state to the path_states of a cell unless an existing path state is at least as good. Any
+        existing path states that the new one is at least as good as are removed. Returns whether it was added.
+        """
+        new_path_length, new_adjacent_garden_bits = new_path_state
+        for path_length, adjacent_garden_bits in path_states:
+            if path_length <= new_path_length and new_adjacent_garden_bits & ~adjacent_garden_bits == 0:
+                return False
+        path_states[:] = [
+            (path_length, adjacent_garden_bits)
+            for path_length, adjacent_garden_bits in path_states
+            if path_length < new_path_length or adjacent_garden_bits & ~new_adjacent_garden_bits != 0
+        ]
+        path_states.append(new_path_state)
+        return True
@@ -2,6 +2,7 @@ from collections.abc import Callable
 
 from .cell import Cell
 from .cell_group import CellGroup
+from .cell_state import CellState
 
 
 class WallSection(CellGroup):
@@ -11,4 +12,10 @@ class WallSection(CellGroup):
 
     @staticmethod
     def get_cell_criteria_func() -> Callable[[Cell], bool]:
-        return lambda cell: cell.cell_state.is_wall()
+        return WallSection.is_wall_section_cell
+
+    @staticmethod
+    def is_wall_section_cell(cell: Cell) -> bool:
+        # This is called for every cell a flood fill visits, so the state is compared directly and the same function is
+        # returned from get_cell_criteria_func each time rather than a new lambda
+        return cell.cell_state is CellState.WALL
@@ -2,6 +2,7 @@ from collections.abc import Callable
 
 from .cell import Cell
 from .cell_group import CellGroup
+from .cell_state import CellState
 
 
 class WeakGarden(CellGroup):
@@ -12,7 +13,13 @@ class WeakGarden(CellGroup):
 
     @staticmethod
     def get_cell_criteria_func() -> Callable[[Cell], bool]:
-        return lambda cell: cell.cell_state.is_weak_garden()
+        return WeakGarden.is_weak_garden_cell
+
+    @staticmethod
+    def is_weak_garden_cell(cell: Cell) -> bool:
+        # Only the three single states are accepted, so zero or combined CellState values never count as weak gardens
+        cell_state = cell.cell_state
+        return cell_state is CellState.EMPTY or cell_state is CellState.NON_WALL or cell_state is CellState.CLUE
 
     def does_have_exactly_one_clue(self) -> bool:
         return self.get_number_of_clues() == 1
@@ -24,4 +31,4 @@ class WeakGarden(CellGroup):
         return self.get_clue_value()
 
     def has_non_wall_cell(self) -> bool:
-        return any(cell.cell_state.is_non_wall() for cell in self.cells)
+        return any(cell.cell_state is CellState.NON_WALL for cell in self.cells)
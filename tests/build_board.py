@@ -1,8 +1,17 @@
+import functools
+import itertools
+
 from nurikabe.board import Board
 from nurikabe.cell_state import CellState
 from nurikabe.level import Level, LevelBuilderFromStringList
 from nurikabe.screen import Screen
 
+# Removes the cell state characters from a row so that only the clues and commas are left
+CELL_STATE_CHARACTER_REMOVAL_TABLE = str.maketrans('', '', '_WO')
+
+# The cell state for each character that marks a cell as a wall or non-wall
+CELL_STATE_BY_CHARACTER = {'W': CellState.WALL, 'O': CellState.NON_WALL}
+
 
 class BadBoardSetupError(Exception):
     pass
@@ -24,33 +33,35 @@ def build_board(screen: Screen, board_details: list[str]) -> Board:
     'O' indicates a cell marked as a non-wall
     A number indicates a cell with clue equaling that number.
     """
-    level = create_level_from_string_list(extract_level_details(board_details))
+    level = create_level_from_board_details(tuple(board_details))
     board = Board(level, screen)
 
-    for row_number, row in enumerate(board_details):
-        cells = row.split(',')
-        for col_number, cell_text in enumerate(cells):
-            cell = board.get_cell_from_grid(row_number, col_number)
-            if cell_text == 'W':
-                cell.update_cell_state(CellState.WALL)
-            elif cell_text == 'O':
-                cell.update_cell_state(CellState.NON_WALL)
-            elif cell_text.isnumeric():
-                # Clue cell
-                pass
-            elif cell_text == '_':
-                # Empty cell
-                pass
-            else:
-                msg = f'Unexpected character in board setup: {cell_text}'
-                raise BadBoardSetupError(msg)
+    # The cell texts are flattened in the same row by row order as the board's flat_cell_list
+    all_cell_texts = itertools.chain.from_iterable(row.split(',') for row in board_details)
+    for cell, cell_text in zip(board.flat_cell_list, all_cell_texts, strict=True):
+        # Empty cells and clue cells are left as they are
+        cell_state = CELL_STATE_BY_CHARACTER.get(cell_text)
+        if cell_state is not None:
+            cell.update_cell_state(cell_state)
+        elif cell_text != '_' and not cell_text.isnumeric():
+            msg = f'Unexpected character in board setup: {cell_text}'
+            raise BadBoardSetupError(msg)
 
     return board
 
 
+@functools.cache
+def create_level_from_board_details(board_details: tuple[str, ...]) -> Level:
+    """
+    A Level is never changed once it is built, so the Level for the same board_details is only built once and then
+    shared by every Board built from them. The Board itself is not shared since the cell states change in each test.
+    """
+    return create_level_from_string_list(extract_level_details(list(board_details)))
+
+
 def create_level_from_string_list(level_details: list[str]) -> Level:
     return LevelBuilderFromStringList(level_details).build_level()
 
 
 def extract_level_details(board_details: list[str]) -> list[str]:
-    return [row.replace('_', '').replace('W', '').replace('O', '') for row in board_details]
+    return [row.translate(CELL_STATE_CHARACTER_REMOVAL_TABLE) for row in board_details]
@@ -16,6 +16,11 @@ class TestBoard(TestCase):
 
 
 class TestBoardSetup(TestBoard):
+    # Coordinates on a board with 3 rows and 4 columns
+    CORNER_COORDINATES = ((0, 0), (0, 3), (2, 0), (2, 3))
+    EDGE_COORDINATES = ((0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 2))
+    CENTER_COORDINATES = ((1, 1), (1, 2))
+
     def test_vertically_adjacent_clues(self) -> None:
         board_details = [
             '1,_',
@@ -40,32 +45,27 @@ class TestBoardSetup(TestBoard):
         ]
         board = self.create_board(board_details)
 
-        corner_cells = (
-            board.get_cell_from_grid(row_number=0, col_number=0),
-            board.get_cell_from_grid(row_number=0, col_number=3),
-            board.get_cell_from_grid(row_number=2, col_number=0),
-            board.get_cell_from_grid(row_number=2, col_number=3),
-        )
-        for corner_cell in corner_cells:
-            self.assertEqual(len(corner_cell.get_neighbor_map()), 3)
+        for coordinates, expected_neighbor_count in (
+            (self.CORNER_COORDINATES, 3),
+            (self.EDGE_COORDINATES, 5),
+            (self.CENTER_COORDINATES, 8),
+        ):
+            for row_number, col_number in coordinates:
+                cell = board.get_cell_from_grid(row_number=row_number, col_number=col_number)
+                self.assertEqual(len(cell.get_neighbor_map()), expected_neighbor_count)
 
-        edge_cells = (
-            board.get_cell_from_grid(row_number=0, col_number=1),
-            board.get_cell_from_grid(row_number=0, col_number=2),
-            board.get_cell_from_grid(row_number=1, col_number=0),
-            board.get_cell_from_grid(row_number=1, col_number=3),
-            board.get_cell_from_grid(row_number=2, col_number=1),
-            board.get_cell_from_grid(row_number=2, col_number=2),
-        )
-        for edge_cell in edge_cells:
-            self.assertEqual(len(edge_cell.get_neighbor_map()), 5)
-
-        center_cells = (
-            board.get_cell_from_grid(row_number=1, col_number=1),
-            board.get_cell_from_grid(row_number=1, col_number=2),
-        )
-        for center_cell in center_cells:
-            self.assertEqual(len(center_cell.get_neighbor_map()), 8)
+    def test_adjacent_flat_indexes(self) -> None:
+        board_details = [
+            '_,_,_,_',
+            '_,_,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        self.assertEqual(set(board.adjacent_flat_indexes[0]), {1, 4})
+        self.assertEqual(set(board.adjacent_flat_indexes[5]), {1, 4, 6, 9})
+        self.assertEqual(set(board.adjacent_flat_indexes[11]), {7, 10})
+        for cell in board.flat_cell_list:
+            self.assertIs(board.flat_cell_list[cell.flat_index], cell)
 
 
 class TestBoardAsSimpleStringList(TestBoard):
@@ -131,6 +131,174 @@ class TestBoardAsSimpleStringList(TestBoard):
             self.create_board(board_details)
 
 
+class TestStateBits(TestBoard):
+    def test_initial_state_bits(self) -> None:
+        board_details = [
+            '_,_,W,2',
+            'W,1,O,_',
+            'O,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        self.assertEqual(board.state_bits[CellState.EMPTY], [0b0011, 0b1000, 0b1110])
+        self.assertEqual(board.state_bits[CellState.WALL], [0b0100, 0b0001, 0b0000])
+        self.assertEqual(board.state_bits[CellState.NON_WALL], [0b0000, 0b0100, 0b0001])
+        self.assertEqual(board.state_bits[CellState.CLUE], [0b1000, 0b0010, 0b0000])
+
+    def test_state_bits_after_cell_changes(self) -> None:
+        board_details = [
+            '_,_,_,2',
+            '_,1,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+
+        board.get_cell_from_grid(row_number=0, col_number=1).update_cell_state(CellState.WALL)
+        board.get_cell_from_grid(row_number=1, col_number=3).update_cell_state(CellState.NON_WALL)
+        board.get_cell_from_grid(row_number=0, col_number=1).update_cell_state(CellState.EMPTY)
+        self.assertEqual(board.state_bits[CellState.EMPTY], [0b0111, 0b0101, 0b1111])
+        self.assertEqual(board.state_bits[CellState.WALL], [0b0000, 0b0000, 0b0000])
+        self.assertEqual(board.state_bits[CellState.NON_WALL], [0b0000, 0b1000, 0b0000])
+
+    def test_get_cells_in_states(self) -> None:
+        board_details = [
+            '_,_,W,2',
+            'W,1,O,_',
+            'O,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        for cell_states in (
+            [CellState.EMPTY],
+            [CellState.WALL],
+            [CellState.NON_WALL, CellState.CLUE],
+            [CellState.NON_WALL, CellState.CLUE, CellState.EMPTY],
+        ):
+            expected_cells = {cell for cell in board.flat_cell_list if cell.cell_state in cell_states}
+            self.assertEqual(board.get_cells_in_states(*cell_states), expected_cells)
+
+    def test_get_cells_in_states_after_cell_changes(self) -> None:
+        board_details = [
+            '_,_,_,2',
+            '_,1,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        wall_cell = board.get_cell_from_grid(row_number=0, col_number=1)
+        non_wall_cell = board.get_cell_from_grid(row_number=1, col_number=3)
+        wall_cell.update_cell_state(CellState.WALL)
+        non_wall_cell.update_cell_state(CellState.NON_WALL)
+        self.assertEqual(board.get_wall_cells(), {wall_cell})
+        self.assertEqual(board.get_non_wall_cells(), {non_wall_cell})
+        self.assertNotIn(wall_cell, board.get_empty_cells())
+
+        # The returned set is a copy, so changing it doesn't change the board's own set of wall cells
+        board.get_wall_cells().clear()
+        self.assertEqual(board.get_wall_cells(), {wall_cell})
+
+        wall_cell.update_cell_state(CellState.EMPTY)
+        self.assertEqual(board.get_wall_cells(), set())
+        self.assertIn(wall_cell, board.get_empty_cells())
+
+    def test_get_row_bits_and_adjacent_row_bits(self) -> None:
+        board_details = [
+            '_,_,_,_',
+            '_,_,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cells = [
+            board.get_cell_from_grid(row_number=1, col_number=0),
+            board.get_cell_from_grid(row_number=1, col_number=1),
+            board.get_cell_from_grid(row_number=2, col_number=3),
+        ]
+        row_bits = board.get_row_bits(cells)
+        self.assertEqual(row_bits, [0b0000, 0b0011, 0b1000])
+        self.assertEqual(board.get_adjacent_row_bits(row_bits), [0b0011, 0b1100, 0b0111])
+
+    def test_get_cells_from_row_bits(self) -> None:
+        board_details = [
+            '_,_,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cells = list(board.get_cells_from_row_bits(row_number=1, row_bits=0b1010))
+        expected_cells = [
+            board.get_cell_from_grid(row_number=1, col_number=1),
+            board.get_cell_from_grid(row_number=1, col_number=3),
+        ]
+        self.assertEqual(cells, expected_cells)
+
+    def test_get_cells_from_all_row_bits(self) -> None:
+        board_details = [
+            '_,_,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cells = list(board.get_cells_from_all_row_bits([0b0100, 0b1001]))
+        expected_cells = [
+            board.get_cell_from_grid(row_number=0, col_number=2),
+            board.get_cell_from_grid(row_number=1, col_number=0),
+            board.get_cell_from_grid(row_number=1, col_number=3),
+        ]
+        self.assertEqual(cells, expected_cells)
+
+    def test_get_connected_row_bits(self) -> None:
+        board_details = [
+            '_,_,_,_',
+            '_,_,_,_',
+            '_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        allowed_row_bits = [0b1011, 0b1001, 0b1111]
+        self.assertEqual(board.get_connected_row_bits([0b0001, 0, 0], allowed_row_bits), [0b1011, 0b1001, 0b1111])
+        self.assertEqual(board.get_connected_row_bits([0, 0, 0], allowed_row_bits), [0, 0, 0])
+        self.assertEqual(board.get_connected_row_bits([0b0100, 0, 0], allowed_row_bits), [0, 0, 0])
+
+    def test_get_row_bits_within_distance(self) -> None:
+        board_details = [
+            '_,_,_,_,_',
+            '_,_,_,_,_',
+            '_,_,_,_,_',
+            '_,_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cell = board.get_cell_from_grid(row_number=1, col_number=1)
+        self.assertEqual(board.get_row_bits_within_distance(cell, 0), [0, 0b00010, 0, 0])
+        self.assertEqual(board.get_row_bits_within_distance(cell, 2), [0b00111, 0b01111, 0b00111, 0b00010])
+        for distance in range(8):
+            expected_row_bits = board.get_row_bits(
+                other_cell for other_cell in board.flat_cell_list if cell.get_manhattan_distance(other_cell) <= distance
+            )
+            self.assertEqual(board.get_row_bits_within_distance(cell, distance), expected_row_bits)
+
+    def test_get_expanded_row_bits(self) -> None:
+        board_details = [
+            '_,_,_,_,_',
+            '_,_,_,_,_',
+            '_,_,_,_,_',
+            '_,_,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        row_bits = [0b00001, 0, 0, 0b10000]
+        self.assertEqual(board.get_expanded_row_bits(row_bits, 0), row_bits)
+        self.assertEqual(board.get_expanded_row_bits(row_bits, 1), [0b00011, 0b00001, 0b10000, 0b11000])
+        self.assertEqual(board.get_expanded_row_bits(row_bits, 10), [0b11111] * 4)
+
+    def test_can_all_walls_connect(self) -> None:
+        connectable_board_details = [
+            '1,_,_,W',
+            'W,_,W,_',
+            '_,3,O,W',
+        ]
+        self.assertTrue(self.create_board(connectable_board_details).can_all_walls_connect())
+
+        isolated_board_details = [
+            '1,_,_,W',
+            'W,O,W,_',
+            '_,3,O,W',
+        ]
+        self.assertFalse(self.create_board(isolated_board_details).can_all_walls_connect())
+
+
 class TestTwoByTwoWall(TestBoard):
     def test_fresh_board_has_no_two_by_two_walls(self) -> None:
         board_details = [
@@ -161,6 +329,22 @@ class TestTwoByTwoWall(TestBoard):
         board = self.create_board(board_details)
         self.assertTrue(board.has_two_by_two_wall())
 
+    def test_get_two_by_two_wall_sections(self) -> None:
+        board_details = [
+            '1,W,W,W',
+            '_,W,W,W',
+            '_,3,_,W',
+        ]
+        board = self.create_board(board_details)
+
+        # The two overlapping two-by-two sections of walls share the middle column of walls
+        expected_cells = {
+            board.get_cell_from_grid(row_number=row_number, col_number=col_number)
+            for row_number in range(2)
+            for col_number in range(1, 4)
+        }
+        self.assertEqual(board.get_two_by_two_wall_sections(), expected_cells)
+
 
 class TestCellGroups(TestBoard):
     def test_get_garden(self) -> None:
@@ -267,6 +451,38 @@ class TestCellGroups(TestBoard):
                 msg = 'Unexpected weak garden size'
                 raise RuntimeError(msg)
 
+    def test_cell_group_caches_are_invalidated_by_cell_change(self) -> None:
+        board_details = [
+            '1,_,_,_,2',
+        ]
+        board = self.create_board(board_details)
+        all_gardens = board.get_all_gardens()
+        all_weak_gardens = board.get_all_weak_gardens()
+        all_wall_sections = board.get_all_wall_sections()
+        all_non_garden_cell_groups_with_walls = board.get_all_non_garden_cell_groups_with_walls()
+        self.assertIs(board.get_all_gardens(), all_gardens)
+        self.assertIs(board.get_all_weak_gardens(), all_weak_gardens)
+        self.assertIs(board.get_all_wall_sections(), all_wall_sections)
+        self.assertIs(board.get_all_non_garden_cell_groups_with_walls(), all_non_garden_cell_groups_with_walls)
+
+        board.get_cell_from_grid(row_number=0, col_number=2).update_cell_state(CellState.WALL)
+        self.assertIsNot(board.get_all_gardens(), all_gardens)
+        self.assertEqual(len(board.get_all_weak_gardens()), 2)
+        self.assertEqual(len(board.get_all_wall_sections()), 1)
+        self.assertEqual(len(board.get_all_non_garden_cell_groups_with_walls()), 1)
+
+    def test_unchanged_cell_state_keeps_cell_group_caches(self) -> None:
+        board_details = [
+            '1,_,W,_,2',
+        ]
+        board = self.create_board(board_details)
+        all_gardens = board.get_all_gardens()
+        board_version = board.version
+
+        board.get_cell_from_grid(row_number=0, col_number=2).update_cell_state(CellState.WALL)
+        self.assertEqual(board.version, board_version)
+        self.assertIs(board.get_all_gardens(), all_gardens)
+
     def test_get_wall_section(self) -> None:
         board_details = [
             '_,_,_,_,_,_',
@@ -334,6 +550,45 @@ class TestCellGroups(TestBoard):
         }
         self.assertEqual(adjacent_neighbor_cells, expected_adjacent_neighbors)
 
+        # The adjacent neighbors of a cell group never change, so they are only found once
+        self.assertIs(cell_group.get_adjacent_neighbors(), adjacent_neighbor_cells)
+
+    def test_get_empty_adjacent_cells(self) -> None:
+        board_details = [
+            '_,W,_,_',
+            '_,2,O,W',
+            'O,_,_,_',
+        ]
+        board = self.create_board(board_details)
+        garden = board.get_garden(board.get_cell_from_grid(row_number=1, col_number=1))
+        expected_empty_adjacent_cells = {
+            board.get_cell_from_grid(row_number=0, col_number=2),
+            board.get_cell_from_grid(row_number=1, col_number=0),
+            board.get_cell_from_grid(row_number=2, col_number=1),
+            board.get_cell_from_grid(row_number=2, col_number=2),
+        }
+        self.assertEqual(board.get_empty_adjacent_cells(garden.cells), expected_empty_adjacent_cells)
+        self.assertEqual(board.get_empty_adjacent_cells(garden.cells), garden.get_empty_adjacent_neighbors())
+
+    def test_cell_group_get_empty_adjacent_neighbors_up_to(self) -> None:
+        board_details = [
+            '_,W,W,O',
+            'W,W,O,_',
+            'O,O,W,_',
+        ]
+        board = self.create_board(board_details)
+        wall_section = board.get_wall_section(board.get_cell_from_grid(row_number=0, col_number=1))
+        only_empty_neighbor = board.get_cell_from_grid(row_number=0, col_number=0)
+        self.assertEqual(wall_section.get_empty_adjacent_neighbors_up_to(limit=2), [only_empty_neighbor])
+
+        board_details = [
+            '_,W,_',
+        ]
+        board = self.create_board(board_details)
+        wall_section = board.get_wall_section(board.get_cell_from_grid(row_number=0, col_number=1))
+        self.assertEqual(len(wall_section.get_empty_adjacent_neighbors_up_to(limit=2)), 2)
+        self.assertEqual(len(wall_section.get_empty_adjacent_neighbors_up_to(limit=1)), 1)
+
     def test_is_garden_fully_enclosed(self) -> None:
         board_details = [
             '_,_,_,2,O,_',
@@ -9,9 +9,13 @@ from nurikabe.direction import Direction
 class TestCell(TestCase):
     screen = MagicMock(name='Screen')
     pixel_position = MagicMock(name='PixelPosition')
+    # Wider than any column number used in these tests
+    NUMBER_OF_COLUMNS = 20
 
     def get_cell(self, row_number: int = 0, col_number: int = 0, clue: int | None = None) -> Cell:
-        return Cell(row_number, col_number, clue, pixel_position=self.pixel_position, screen=self.screen)
+        # These cells are not part of a board, so the flat index is only made unique per grid coordinate
+        flat_index = row_number * self.NUMBER_OF_COLUMNS + col_number
+        return Cell(row_number, col_number, flat_index, clue, pixel_position=self.pixel_position, screen=self.screen)
 
 
 class TestCellDistance(TestCell):
@@ -60,6 +64,14 @@ class TestCellState(TestCell):
         cell.handle_cell_click()
         self.assertIs(cell.cell_state, CellState.CLUE)
 
+    def test_invalid_cell_state(self) -> None:
+        """Zero or combined CellState values are not valid cell states, so the cell rejects them and does not change."""
+        cell = self.get_cell()
+        for cell_state in (CellState(0), CellState.WALL | CellState.EMPTY):
+            with self.assertRaises(ValueError):
+                cell.update_cell_state(cell_state)
+            self.assertIs(cell.cell_state, CellState.EMPTY)
+
 
 class TestCellNeighbors(TestCell):
     def test_get_neighbor_methods(self) -> None:
@@ -3,14 +3,32 @@ from unittest.mock import MagicMock
 
 from nurikabe.cell import Cell
 from nurikabe.cell_group import CellGroup, MultipleCluesInCellGroupError, NoCluesInCellGroupError
+from nurikabe.pixel_position import PixelPosition
+from nurikabe.rect_edge import RectEdge
 
 
 class TestCellGroup(TestCase):
     screen = MagicMock(name='Screen')
     pixel_position = MagicMock(name='PixelPosition')
+    # Wider than any column number used in these tests
+    NUMBER_OF_COLUMNS = 20
 
     def get_cell(self, row_number: int = 0, col_number: int = 0, clue: int | None = None) -> Cell:
-        return Cell(row_number, col_number, clue, pixel_position=self.pixel_position, screen=self.screen)
+        # These cells are not part of a board, so the flat index is only made unique per grid coordinate
+        flat_index = row_number * self.NUMBER_OF_COLUMNS + col_number
+        return Cell(row_number, col_number, flat_index, clue, pixel_position=self.pixel_position, screen=self.screen)
+
+    def test_cells_are_a_copy_that_cannot_change(self) -> None:
+        """Changing the set the cell group was made from does not change the cell group or its cached hash."""
+        cells = {self.get_cell(row_number=0), self.get_cell(row_number=1)}
+        cell_group = CellGroup(cells)
+        original_hash = hash(cell_group)
+
+        cells.add(self.get_cell(row_number=2))
+        self.assertIsInstance(cell_group.cells, frozenset)
+        self.assertEqual(len(cell_group.cells), 2)
+        self.assertEqual(hash(cell_group), original_hash)
+        self.assertEqual(cell_group, CellGroup({self.get_cell(row_number=0), self.get_cell(row_number=1)}))
 
     def test_contains_zero_clues(self) -> None:
         cells = {self.get_cell(clue=None) for _ in range(5)}
@@ -72,6 +90,27 @@ class TestCellGroup(TestCase):
         destination_cell_in_cell_group = self.get_cell(row_number=5, col_number=5)
         self.assertEqual(cell_group.get_shortest_manhattan_distance_to_cell(destination_cell_in_cell_group), 0)
 
+    def test_get_shortest_manhattan_distance_to_cells(self) -> None:
+        cells_in_cell_group = {
+            self.get_cell(row_number=5, col_number=4),
+            self.get_cell(row_number=5, col_number=5),
+            self.get_cell(row_number=6, col_number=5),
+        }
+        cell_group = CellGroup(cells_in_cell_group)
+
+        destination_cells = [
+            self.get_cell(row_number=5, col_number=3),
+            self.get_cell(row_number=10, col_number=10),
+            self.get_cell(row_number=7, col_number=3),
+            self.get_cell(row_number=5, col_number=5),
+        ]
+        distances = cell_group.get_shortest_manhattan_distance_to_cells(destination_cells)
+        self.assertEqual(distances, dict(zip(destination_cells, [1, 9, 3, 0], strict=True)))
+        for destination_cell in destination_cells:
+            self.assertEqual(
+                distances[destination_cell], cell_group.get_shortest_manhattan_distance_to_cell(destination_cell)
+            )
+
     def test_get_shortest_manhattan_distance_to_cell_group(self) -> None:
         cells_in_source_cell_group = {
             self.get_cell(row_number=5, col_number=4),
@@ -110,3 +149,28 @@ class TestCellGroup(TestCase):
         }
         destination_cell_group4 = CellGroup(cells_in_destination_cell_group4)
         self.assertEqual(source_cell_group.get_shortest_manhattan_distance_to_cell_group(destination_cell_group4), 0)
+
+    def test_get_edges(self) -> None:
+        screen = MagicMock(name='Screen', cell_width=10)
+        cells = {
+            Cell(
+                row_number,
+                col_number,
+                row_number * self.NUMBER_OF_COLUMNS + col_number,
+                None,
+                PixelPosition(x_coordinate=10 * col_number, y_coordinate=10 * row_number),
+                screen,
+            )
+            for row_number, col_number in ((0, 0), (0, 1), (1, 1))
+        }
+        edges = CellGroup(cells).get_edges()
+
+        self.assertEqual(len(edges), 8)
+        shared_edge = RectEdge(
+            PixelPosition(x_coordinate=10, y_coordinate=0), PixelPosition(x_coordinate=10, y_coordinate=10)
+        )
+        self.assertNotIn(shared_edge, edges)
+        outer_edge = RectEdge(
+            PixelPosition(x_coordinate=0, y_coordinate=0), PixelPosition(x_coordinate=10, y_coordinate=0)
+        )
+        self.assertIn(outer_edge, edges)
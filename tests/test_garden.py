@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 from nurikabe.cell import Cell
 from nurikabe.cell_group import MultipleCluesInCellGroupError, NoCluesInCellGroupError
+from nurikabe.cell_state import CellState
 from nurikabe.garden import Garden
 
 
@@ -16,7 +17,12 @@ class TestGarden(TestCase):
 
     def get_cell(self, clue: int | None = None) -> Cell:
         cell = Cell(
-            row_number=self.row_number, col_number=0, clue=clue, pixel_position=self.pixel_position, screen=self.screen
+            row_number=self.row_number,
+            col_number=0,
+            flat_index=self.row_number,
+            clue=clue,
+            pixel_position=self.pixel_position,
+            screen=self.screen,
         )
         self.row_number += 1
         return cell
@@ -43,3 +49,13 @@ class TestGarden(TestCase):
 
         with self.assertRaises(MultipleCluesInCellGroupError):
             garden_multiple_clues.get_num_of_remaining_garden_cells()
+
+    def test_cell_criteria_func(self) -> None:
+        cell_criteria_func = Garden.get_cell_criteria_func()
+        self.assertIs(Garden.get_cell_criteria_func(), cell_criteria_func)
+
+        self.assertTrue(cell_criteria_func(self.get_cell(clue=3)))
+        cell = self.get_cell()
+        for cell_state in (CellState.EMPTY, CellState.WALL, CellState.NON_WALL):
+            cell.update_cell_state(cell_state)
+            self.assertEqual(cell_criteria_func(cell), cell_state.is_garden())
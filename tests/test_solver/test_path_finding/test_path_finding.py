@@ -29,7 +29,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
         board = self.create_board(board_details)
         cell = board.get_cell_from_grid(row_number=1, col_number=2)
         shortest_path_between_cells = PathFinder(start_cell_group=cell, end_cell_group=cell).get_path_info()
-        self.assertEqual(shortest_path_between_cells.cell_list, [cell])
+        self.assertEqual(shortest_path_between_cells.get_cell_list(), [cell])
 
     def test_path_too_long(self) -> None:
         """Set the max path length to zero. We expect NoPathFoundError to be thrown."""
@@ -62,13 +62,13 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=1, col_number=2),
             board.get_cell_from_grid(row_number=1, col_number=3),
         ]
-        self.assertEqual(shortest_path_between_cells.cell_list, expected)
+        self.assertEqual(shortest_path_between_cells.get_cell_list(), expected)
 
         # The path from end_cell to start_cell should be the reverse of the path above
         backwards_path = PathFinder(
             start_cell_group=path_finder.end_cell_group, end_cell_group=path_finder.start_cell_group
         ).get_path_info()
-        self.assertEqual(backwards_path.cell_list, shortest_path_between_cells.cell_list[::-1])
+        self.assertEqual(backwards_path.get_cell_list(), shortest_path_between_cells.get_cell_list()[::-1])
 
     def test_diagonal_path_between_cells(self) -> None:
         """
@@ -106,7 +106,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=0, col_number=0),
             board.get_cell_from_grid(row_number=0, col_number=1),
         ]
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
 
     def test_path_between_cells_with_unimportant_off_limit_cells(self) -> None:
         """
@@ -129,7 +129,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=1, col_number=1),
             board.get_cell_from_grid(row_number=0, col_number=1),
         ]
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
 
     def test_path_between_cells_with_no_possible_path(self) -> None:
         """
@@ -180,12 +180,12 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=4, col_number=5),
             board.get_cell_from_grid(row_number=4, col_number=4),
         ]
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
         self.assertEqual(path_info.path_length, 16)
 
         # If we limit the number of length of the path to 16, this should still be considered viable
         path_info_with_limit = path_finder.get_path_info(max_path_length=16)
-        self.assertEqual(path_info_with_limit.cell_list, expected)
+        self.assertEqual(path_info_with_limit.get_cell_list(), expected)
 
         # If we limit the number of length of the path to 15, then there is no path possible, so an error should be
         # thrown
@@ -229,7 +229,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=0, col_number=0),
         ]
 
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
         self.assertEqual(path_info.path_length, 5)
 
     def test_path_between_cells_adjacent_with_other_small_enough_cell_group_in_multiple_places(self) -> None:
@@ -256,7 +256,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=0, col_number=0),
         ]
 
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
         self.assertEqual(path_info.path_length, 7)
 
     def test_path_between_cells_leverage_other_cell_group(self) -> None:
@@ -288,7 +288,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=0, col_number=1),
             board.get_cell_from_grid(row_number=0, col_number=0),
         ]
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
         self.assertEqual(path_info.path_length, 7)
 
     def test_path_between_cells_adjacent_with_multiple_cell_groups(self) -> None:
@@ -313,7 +313,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=0, col_number=2),
         ]
 
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
         self.assertEqual(path_info.path_length, 7)
 
     def test_go_long_way_around_due_to_large_other_cell_group(self) -> None:
@@ -365,7 +365,7 @@ class TestPathFindingBetweenCells(TestPathFinding):
             board.get_cell_from_grid(row_number=7, col_number=7),
         ]
 
-        self.assertEqual(path_info.cell_list, expected)
+        self.assertEqual(path_info.get_cell_list(), expected)
         self.assertEqual(path_info.path_length, 22)
 
 
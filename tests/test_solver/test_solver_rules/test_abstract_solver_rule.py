@@ -0,0 +1,44 @@
+import logging
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from nurikabe.board import Board
+from nurikabe.cell_state import CellState
+from nurikabe.solver.solver_rules.abstract_solver_rule import SolverRule
+from tests.build_board import build_board
+
+LOGGER_NAME = 'nurikabe.solver.solver_rules.abstract_solver_rule'
+
+
+class TestSolverRule(TestCase):
+    screen = MagicMock(name='Screen')
+
+    def create_board(self, board_details: list[str]) -> Board:
+        return build_board(self.screen, board_details)
+
+    def test_set_cell_to_state_logs_state_name(self) -> None:
+        """The target cell state is logged by name rather than by its integer value."""
+        board_details = [
+            '_,_',
+            '_,1',
+        ]
+        board = self.create_board(board_details)
+        cell = board.get_cell_from_grid(row_number=0, col_number=0)
+        with self.assertLogs(LOGGER_NAME, level=logging.DEBUG) as captured_logs:
+            SolverRule.set_cell_to_state(cell, CellState.WALL, reason='Test reason')
+        self.assertTrue(captured_logs.records[0].getMessage().endswith(' to WALL. Reason: Test reason'))
+
+    def test_set_cells_to_state_logs_state_name(self) -> None:
+        """The target cell state is logged by name once for the whole batch of cells."""
+        board_details = [
+            '_,_',
+            '_,1',
+        ]
+        board = self.create_board(board_details)
+        cells = [
+            board.get_cell_from_grid(row_number=0, col_number=0),
+            board.get_cell_from_grid(row_number=0, col_number=1),
+        ]
+        with self.assertLogs(LOGGER_NAME, level=logging.DEBUG) as captured_logs:
+            SolverRule.set_cells_to_state(cells, CellState.NON_WALL, reason='Test reason')
+        self.assertTrue(captured_logs.records[0].getMessage().endswith(' to NON_WALL. Reason: Test reason'))
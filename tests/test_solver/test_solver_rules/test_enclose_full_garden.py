@@ -63,3 +63,18 @@ class TestEncloseFullGarden(TestCase):
         board = self.create_board(board_details)
         with self.assertRaises(NoPossibleSolutionFromCurrentStateError):
             EncloseFullGarden(board).apply_rule()
+
+    def test_full_gardens_sharing_an_adjacent_cell(self) -> None:
+        """If an empty cell is adjacent to more than one full garden, it is only changed to a wall once."""
+        board_details = [
+            '1,_,1',
+            '_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = EncloseFullGarden(board).apply_rule()
+        self.assertEqual(len(cell_changes.cell_change_list), 3)
+        expected_board_state = [
+            '1,W,1',
+            'W,_,W',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
@@ -121,10 +121,10 @@ class TestEnsureGardenCanExpandOneRoute(TestCase):
 
     def test_multiple_gardens_where_solver_rule_applies(self) -> None:
         """
-        If there are multiple cells where this rule applies and should be marked as non-wall cells, it requires multiple
-        iterations of this solver rule to mark all the cells as non-walls. Each iteration can only mark one cell as a
-        non-wall. The reason for this is that once a cell is marked as a non-wall, the set of gardens can change.
-        Therefore, the set of gardens be re-derived before potentially marking another cell as a non-wall.
+        If there are multiple cells where this rule applies and should be marked as non-wall cells, it can require
+        multiple iterations of this solver rule to mark all the cells as non-walls. The reason for this is that once a
+        cell is marked as a non-wall, the gardens next to it can change. Therefore, those gardens must be re-derived
+        before potentially marking another cell next to them as a non-wall.
         """
         board_details = [
             '_,_,_,_',
@@ -158,3 +158,21 @@ class TestEnsureGardenCanExpandOneRoute(TestCase):
         cell_changes = ensure_garden_can_expand_solver_rule.apply_rule()
         self.assertFalse(cell_changes.has_any_changes())
         self.assertEqual(board.as_simple_string_list(), expected_board_state2)
+
+    def test_multiple_separate_gardens_expand_in_one_iteration(self) -> None:
+        """
+        If the gardens where this rule applies are not next to each other, a cell being marked as a non-wall for one of
+        them does not change the other, so they can all be expanded in a single iteration of this solver rule.
+        """
+        board_details = [
+            '2,W,_,W,2',
+            '_,W,_,W,_',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = EnsureGardenCanExpandOneRoute(board).apply_rule()
+        self.assertEqual(len(cell_changes.cell_change_list), 2)
+        expected_board_state = [
+            '2,W,_,W,2',
+            'O,W,_,W,O',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
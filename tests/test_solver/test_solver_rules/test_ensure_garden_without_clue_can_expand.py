@@ -1,9 +1,10 @@
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from nurikabe.board import Board
 from nurikabe.solver.solver_rules.ensure_garden_without_clue_can_expand import (
     EnsureGardenWithoutClueCanExpand,
+    GardenInfo,
     NoPossibleSolutionFromCurrentStateError,
 )
 from tests.build_board import build_board
@@ -189,7 +190,8 @@ class TestEnsureGardenWithoutClueCanExpand(TestCase):
         A garden has multiple adjacent cells that it can expand through. There is a non-adjacent cell that must be part
         of the garden or else it will prevent the garden from expanding in a way that will allow it to reach a clue
         cell. This example is further complicated since the path to the escape route cell goes through another
-        incomplete garden with no clue. We still expect that the escape route cell is marked as a non-wall.
+        incomplete garden with no clue. We still expect that the escape route cell is marked as a non-wall. The cell
+        below it is on every path to the clue cell as well, so it is also marked as a non-wall.
         """
         board_details = [
             'W,O,O,W',
@@ -207,17 +209,43 @@ class TestEnsureGardenWithoutClueCanExpand(TestCase):
             'W,_,_,W',
             'W,O,_,W',
             '_,O,W,_',
-            '_,_,_,_',
+            '_,O,_,_',
             '_,8,_,_',
         ]
         self.assertEqual(board.as_simple_string_list(), expected_board_state)
 
-    def test_multiple_gardens_where_solver_rule_applies(self) -> None:
+    def test_multiple_cells_where_solver_rule_applies(self) -> None:
         """
-        If there are multiple cells where this rule applies and should be marked as non-wall cells, it requires multiple
-        iterations of this solver rule to mark all the cells as non-walls. Each iteration can only mark one cell as a
-        non-wall. The reason for this is that once a cell is marked as a non-wall, the set of gardens can change.
-        Therefore, the set of gardens be re-derived before potentially marking another cell as a non-wall.
+        If there are multiple cells where this rule applies and should be marked as non-wall cells, they are all marked
+        as non-walls in a single iteration of this solver rule.
+        """
+        board_details = [
+            '_,_,_,_',
+            '5,_,W,W',
+            '_,_,_,O',
+        ]
+        board = self.create_board(board_details)
+        ensure_garden_without_clue_can_expand_solver_rule = EnsureGardenWithoutClueCanExpand(board)
+
+        cell_changes = ensure_garden_without_clue_can_expand_solver_rule.apply_rule()
+        self.assertEqual(len(cell_changes.cell_change_list), 2)
+        expected_board_state = [
+            '_,_,_,_',
+            '5,_,W,W',
+            '_,O,O,O',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
+
+        # On the second iteration, there are no more cells to apply this solver rule to, so the board is unchanged
+        cell_changes = ensure_garden_without_clue_can_expand_solver_rule.apply_rule()
+        self.assertFalse(cell_changes.has_any_changes())
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
+
+    @patch.object(EnsureGardenWithoutClueCanExpand, 'SHOULD_EMIT_ALL_NON_WALL_CELLS', new=False)
+    def test_multiple_cells_where_solver_rule_applies_one_at_a_time(self) -> None:
+        """
+        If the solver rule is set to only emit a single non-wall cell per iteration, it requires multiple iterations of
+        this solver rule to mark all the cells as non-walls.
         """
         board_details = [
             '_,_,_,_',
@@ -251,3 +279,36 @@ class TestEnsureGardenWithoutClueCanExpand(TestCase):
         cell_changes = ensure_garden_without_clue_can_expand_solver_rule.apply_rule()
         self.assertFalse(cell_changes.has_any_changes())
         self.assertEqual(board.as_simple_string_list(), expected_board_state2)
+
+    def test_flood_fill_prefilter_excludes_walled_off_garden(self) -> None:
+        """
+        The flood fill from the garden without a clue stops at the column of walls, so the garden with a clue on the
+        other side is filtered out before any path search. The garden with a clue on the same side is kept.
+        """
+        board_details = [
+            'O,_,W,_',
+            '_,_,W,3',
+            '4,_,W,_',
+        ]
+        board = self.create_board(board_details)
+        garden_info = GardenInfo(board)
+        garden_without_clue = board.get_garden(board.get_cell_from_grid(row_number=0, col_number=0))
+
+        flood_fill_reachable_cells = garden_info.get_flood_fill_reachable_cells(garden_without_clue)
+        expected_cells = {
+            board.get_cell_from_grid(row_number=row_number, col_number=col_number)
+            for row_number in range(3)
+            for col_number in range(2)
+        }
+        self.assertEqual(flood_fill_reachable_cells, expected_cells)
+
+        walled_off_garden = board.get_garden(board.get_cell_from_grid(row_number=1, col_number=3))
+        same_side_garden = board.get_garden(board.get_cell_from_grid(row_number=2, col_number=0))
+        self.assertFalse(walled_off_garden.does_include_cell(flood_fill_reachable_cells))
+        self.assertTrue(same_side_garden.does_include_cell(flood_fill_reachable_cells))
+
+        reachable_gardens = {
+            path_to_garden_info.garden
+            for path_to_garden_info in garden_info.get_reachable_gardens_and_path(garden_without_clue)
+        }
+        self.assertEqual(reachable_gardens, {same_side_garden})
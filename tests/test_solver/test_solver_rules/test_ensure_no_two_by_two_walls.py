@@ -44,6 +44,23 @@ class TestEnsureNoTwoByTwoWalls(TestCase):
         ]
         self.assertEqual(board.as_simple_string_list(), expected_board_state)
 
+    def test_two_by_two_sections_share_empty_cell(self) -> None:
+        """An empty cell shared by two sections of three walls should only be changed once."""
+        board_details = [
+            'W,_,W',
+            'W,W,W',
+            '_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = EnsureNoTwoByTwoWalls(board).apply_rule()
+        self.assertEqual(len(cell_changes.cell_change_list), 1)
+        expected_board_state = [
+            'W,O,W',
+            'W,W,W',
+            '_,_,_',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
+
     def test_has_two_by_two_walls(self) -> None:
         """
         If there is already a two-by-two section of walls, the board is not in a solvable state, so an error is thrown.
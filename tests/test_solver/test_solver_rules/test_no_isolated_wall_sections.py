@@ -148,3 +148,26 @@ class TestNoIsolatedWallSections(TestCase):
         cell_changes = NoIsolatedWallSections(board).apply_rule()
         self.assertFalse(cell_changes.has_any_changes())
         self.assertEqual(board.as_simple_string_list(), board_details)
+
+    def test_cell_only_cutting_off_empty_cells(self) -> None:
+        """
+        An empty cell that would only cut off other empty cells from the wall sections if it were to be marked as a
+        non-wall is not critical to connecting the wall sections. Therefore, it should not be marked as a wall, while
+        the cell that is critical to connecting the wall sections should be.
+        """
+        board_details = [
+            'W,_,O,_,_',
+            'O,_,O,_,O',
+            '_,_,_,_,O',
+            'O,O,W,O,_',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = NoIsolatedWallSections(board).apply_rule()
+        self.assertEqual(len(cell_changes.cell_change_list), 4)
+        expected_board_state = [
+            'W,W,O,_,_',
+            'O,W,O,_,O',
+            '_,W,W,_,O',
+            'O,O,W,O,_',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
@@ -116,11 +116,9 @@ class TestNoIsolatedWallSectionsNaive(TestCase):
 
     def test_multiple_cells_in_only_escape_route(self) -> None:
         """
-        If the wall section must extend through multiple cells that make up the escape route, it requires multiple
-        iterations of this solver rule to mark all the escape route cells as walls. Each iteration can only mark one
-        cell as a wall. The reason for this is that once a cell is marked as a wall, the set of wall sections can
-        change. Therefore, the set of wall sections must be re-derived before potentially marking another cell as a
-        wall.
+        If the wall section must extend through multiple cells that make up the escape route, the wall section keeps
+        being extended through its only escape route until it has more than one escape route. This means all the escape
+        route cells are marked as walls in a single iteration of this solver rule.
         """
         board_details = [
             '_,W,_,_',
@@ -130,27 +128,54 @@ class TestNoIsolatedWallSectionsNaive(TestCase):
         board = self.create_board(board_details)
         no_isolated_wall_sections_solver_rule = NoIsolatedWallSectionsNaive(board)
 
-        # First iteration of the solver rule should only change one cell
         cell_changes = no_isolated_wall_sections_solver_rule.apply_rule()
-        self.assertTrue(cell_changes.has_any_changes())
-        expected_board_state1 = [
+        self.assertEqual(len(cell_changes.cell_change_list), 2)
+        expected_board_state = [
             '_,W,_,_',
             '_,_,O,O',
-            '_,_,W,W',
+            '_,W,W,W',
         ]
-        self.assertEqual(board.as_simple_string_list(), expected_board_state1)
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
 
-        # Second iteration of the solver rule should also change one cell
+        # On the second iteration, there are no more cells to apply this solver rule to, so the board is unchanged
         cell_changes = no_isolated_wall_sections_solver_rule.apply_rule()
+        self.assertFalse(cell_changes.has_any_changes())
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
+
+    def test_escape_route_connects_all_walls(self) -> None:
+        """
+        Once the escape route cells connect all the walls into one wall section, the wall section is not extended any
+        further even if it only has one escape route left.
+        """
+        board_details = [
+            'W,O,_',
+            '_,O,W',
+            '_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = NoIsolatedWallSectionsNaive(board).apply_rule()
         self.assertTrue(cell_changes.has_any_changes())
-        expected_board_state2 = [
-            '_,W,_,_',
-            '_,_,O,O',
-            '_,W,W,W',
+        expected_board_state = [
+            'W,O,_',
+            'W,O,W',
+            'W,W,W',
         ]
-        self.assertEqual(board.as_simple_string_list(), expected_board_state2)
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
 
-        # On the third iteration, there are no more cells to apply this solver rule to, so the board is unchanged
-        cell_changes = no_isolated_wall_sections_solver_rule.apply_rule()
-        self.assertFalse(cell_changes.has_any_changes())
-        self.assertEqual(board.as_simple_string_list(), expected_board_state2)
+    def test_multiple_separate_wall_sections_expand_in_one_iteration(self) -> None:
+        """
+        If the wall sections with only one escape route are not next to each other, a cell being marked as a wall for
+        one of them does not change the other, so they can all be expanded in a single iteration of this solver rule.
+        """
+        board_details = [
+            'W,_,_,_,_,W',
+            'O,_,_,_,_,O',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = NoIsolatedWallSectionsNaive(board).apply_rule()
+        self.assertEqual(len(cell_changes.cell_change_list), 2)
+        expected_board_state = [
+            'W,W,_,_,W,W',
+            'O,_,_,_,_,O',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
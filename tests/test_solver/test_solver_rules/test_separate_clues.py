@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock
 
 from nurikabe.board import Board
+from nurikabe.cell_state import CellState
 from nurikabe.solver.solver_rules.separate_clues import SeparateClues
 from tests.build_board import build_board
 
@@ -72,3 +73,21 @@ class TestSeparateClues(TestCase):
         cell_changes = SeparateClues(board).apply_rule()
         self.assertFalse(cell_changes.has_any_changes())
         self.assertEqual(board.as_simple_string_list(), board_details)
+
+    def test_reapply_after_cell_change(self) -> None:
+        """
+        The same solver rule instance is used for every iteration of the solver, so it must pick up cells that become
+        empty again after it was created.
+        """
+        board_details = [
+            '1,_,3',
+            '_,_,_',
+        ]
+        board = self.create_board(board_details)
+        separate_clues_solver_rule = SeparateClues(board)
+        self.assertTrue(separate_clues_solver_rule.apply_rule().has_any_changes())
+        self.assertEqual(board.as_simple_string_list(), ['1,W,3', '_,_,_'])
+
+        board.get_cell_from_grid(row_number=0, col_number=1).update_cell_state(CellState.EMPTY)
+        self.assertTrue(separate_clues_solver_rule.apply_rule().has_any_changes())
+        self.assertEqual(board.as_simple_string_list(), ['1,W,3', '_,_,_'])
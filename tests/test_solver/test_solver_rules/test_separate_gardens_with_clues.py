@@ -74,3 +74,21 @@ class TestSeparateGardensWithClues(TestCase):
         cell_changes = SeparateGardensWithClues(board).apply_rule()
         self.assertFalse(cell_changes.has_any_changes())
         self.assertEqual(board.as_simple_string_list(), board_details)
+
+    def test_cell_adjacent_to_three_gardens(self) -> None:
+        """A cell that is adjacent to three gardens with a clue is only marked as a wall once."""
+        board_details = [
+            '_,3,_',
+            '2,_,2',
+            '_,_,_',
+        ]
+        board = self.create_board(board_details)
+        cell_changes = SeparateGardensWithClues(board).apply_rule()
+
+        self.assertEqual(len(cell_changes.cell_change_list), 3)
+        expected_board_state = [
+            'W,3,W',
+            '2,W,2',
+            '_,_,_',
+        ]
+        self.assertEqual(board.as_simple_string_list(), expected_board_state)
@@ -2,7 +2,8 @@ from unittest import TestCase
 from unittest.mock import MagicMock
 
 from nurikabe.board import Board
-from nurikabe.solver.solver_rules.unreachable_from_garden import UnreachableFromGarden
+from nurikabe.cell import Cell
+from nurikabe.solver.solver_rules.unreachable_from_garden import GardenReachFinder, UnreachableFromGarden
 from tests.build_board import build_board
 
 
@@ -182,3 +183,116 @@ class TestUnreachableFromGarden(TestCase):
         cell_changes = UnreachableFromGarden(board).apply_rule()
         self.assertFalse(cell_changes.has_any_changes())
         self.assertEqual(board.as_simple_string_list(), board_details)
+
+    def test_get_off_limit_row_bits_by_garden(self) -> None:
+        """Each garden's off limit cells are the walls plus the cells of every other garden."""
+        wall_row_bits = [0b1000, 0b0000]
+        garden_row_bits = [[0b0001, 0b0000], [0b0010, 0b0000], [0b0000, 0b0100]]
+        off_limit_row_bits_by_garden = UnreachableFromGarden.get_off_limit_row_bits_by_garden(
+            wall_row_bits, garden_row_bits
+        )
+        self.assertEqual(off_limit_row_bits_by_garden, [[0b1010, 0b0100], [0b1001, 0b0100], [0b1011, 0b0000]])
+        self.assertEqual(UnreachableFromGarden.get_off_limit_row_bits_by_garden(wall_row_bits, []), [])
+
+
+class TestGardenReachFinder(TestCase):
+    screen = MagicMock(name='Screen')
+
+    def create_board(self, board_details: list[str]) -> Board:
+        return build_board(self.screen, board_details)
+
+    def create_garden_reach_finder(self, board: Board) -> GardenReachFinder:
+        """The clue cell is in the top left corner and the garden without a clue is in the bottom row."""
+        return GardenReachFinder(
+            source_garden=board.get_garden(board.get_cell_from_grid(row_number=0, col_number=0)),
+            off_limit_cells=set(),
+            gardens_without_clue=frozenset({board.get_garden(board.get_cell_from_grid(row_number=2, col_number=1))}),
+        )
+
+    def test_add_path_state(self) -> None:
+        """
+        A path state is only added if no existing path state is both no longer and adjacent to at least the same
+        gardens. Adding it removes the existing path states that it is at least as good as.
+        """
+        path_states: list[tuple[int, int]] = []
+        self.assertTrue(GardenReachFinder.add_path_state(path_states, (3, 0b01)))
+        self.assertEqual(path_states, [(3, 0b01)])
+
+        # Longer and adjacent to the same gardens
+        self.assertFalse(GardenReachFinder.add_path_state(path_states, (4, 0b01)))
+        # Same length and adjacent to fewer gardens
+        self.assertFalse(GardenReachFinder.add_path_state(path_states, (3, 0b00)))
+        self.assertEqual(path_states, [(3, 0b01)])
+
+        # Longer, but adjacent to a garden the existing path state is not adjacent to, so both are kept
+        self.assertTrue(GardenReachFinder.add_path_state(path_states, (4, 0b10)))
+        self.assertEqual(path_states, [(3, 0b01), (4, 0b10)])
+
+        # No longer than either and adjacent to all of their gardens, so it replaces both of them
+        self.assertTrue(GardenReachFinder.add_path_state(path_states, (3, 0b11)))
+        self.assertEqual(path_states, [(3, 0b11)])
+
+    def test_step_length_adjacent_to_garden_without_clue(self) -> None:
+        """The first step that goes adjacent to a garden without a clue adds the size of that garden."""
+        board_details = [
+            '3,_,_',
+            '_,_,_',
+            '_,O,O',
+        ]
+        board = self.create_board(board_details)
+        garden_reach_finder = self.create_garden_reach_finder(board)
+
+        cell_above_garden = board.get_cell_from_grid(row_number=1, col_number=1)
+        garden_bits = garden_reach_finder.get_adjacent_garden_bits(cell_above_garden)
+        self.assertEqual(garden_bits, 0b1)
+        self.assertEqual(garden_reach_finder.get_step_length(cell_above_garden, garden_bits), 1 + 2)
+
+        # A step to a cell that is not adjacent to any garden without a clue only adds one
+        cell_away_from_garden = board.get_cell_from_grid(row_number=0, col_number=1)
+        self.assertEqual(garden_reach_finder.get_adjacent_garden_bits(cell_away_from_garden), 0)
+        self.assertEqual(garden_reach_finder.get_step_length(cell_away_from_garden, 0), 1)
+
+    def test_step_length_into_garden_without_clue(self) -> None:
+        """Once the path is adjacent to a garden without a clue, a step into that garden adds nothing."""
+        board_details = [
+            '3,_,_',
+            '_,_,_',
+            '_,O,O',
+        ]
+        board = self.create_board(board_details)
+        garden_reach_finder = self.create_garden_reach_finder(board)
+
+        garden_cell = board.get_cell_from_grid(row_number=2, col_number=1)
+        self.assertEqual(garden_reach_finder.get_step_length(garden_cell, newly_adjacent_garden_bits=0), 0)
+
+    def test_get_cells_within_reach(self) -> None:
+        """
+        Going adjacent to the garden without a clue costs a step plus its two cells, and then the steps within that
+        garden are free. The last empty cell on the right needs one more step after that.
+        """
+        board_details = [
+            '3,_,_',
+            '_,_,_',
+            '_,O,O',
+        ]
+        board = self.create_board(board_details)
+
+        def get_cells(coordinates: set[tuple[int, int]]) -> set[Cell]:
+            return {board.get_cell_from_grid(row_number=row, col_number=col) for row, col in coordinates}
+
+        cells_within_four = {(0, 0), (0, 1), (0, 2), (1, 0)}
+        self.assertEqual(
+            self.create_garden_reach_finder(board).get_cells_within_reach(max_path_length=4),
+            get_cells(cells_within_four),
+        )
+
+        cells_within_five = cells_within_four | {(1, 1), (2, 0), (2, 1), (2, 2)}
+        self.assertEqual(
+            self.create_garden_reach_finder(board).get_cells_within_reach(max_path_length=5),
+            get_cells(cells_within_five),
+        )
+
+        self.assertEqual(
+            self.create_garden_reach_finder(board).get_cells_within_reach(max_path_length=6),
+            set(board.flat_cell_list),
+        )
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 from nurikabe.cell import Cell
 from nurikabe.cell_group import MultipleCluesInCellGroupError, NoCluesInCellGroupError
+from nurikabe.cell_state import CellState
 from nurikabe.weak_garden import WeakGarden
 
 
@@ -16,7 +17,12 @@ class TestWeakGarden(TestCase):
 
     def get_cell(self, clue: int | None = None) -> Cell:
         cell = Cell(
-            row_number=self.row_number, col_number=0, clue=clue, pixel_position=self.pixel_position, screen=self.screen
+            row_number=self.row_number,
+            col_number=0,
+            flat_index=self.row_number,
+            clue=clue,
+            pixel_position=self.pixel_position,
+            screen=self.screen,
         )
         self.row_number += 1
         return cell
@@ -59,3 +65,27 @@ class TestWeakGarden(TestCase):
 
         with self.assertRaises(MultipleCluesInCellGroupError):
             weak_garden_multiple_clues.is_garden_correct_size()
+
+    def test_cell_criteria_func(self) -> None:
+        cell_criteria_func = WeakGarden.get_cell_criteria_func()
+        self.assertIs(WeakGarden.get_cell_criteria_func(), cell_criteria_func)
+
+        self.assertTrue(cell_criteria_func(self.get_cell(clue=3)))
+        cell = self.get_cell()
+        for cell_state in (CellState.EMPTY, CellState.WALL, CellState.NON_WALL):
+            cell.update_cell_state(cell_state)
+            self.assertEqual(cell_criteria_func(cell), cell_state.is_weak_garden())
+
+    def test_is_weak_garden_only_for_single_cell_states(self) -> None:
+        """Only the empty, non-wall and clue states are weak garden states, not zero or combined flag values."""
+        for cell_state in (CellState.EMPTY, CellState.NON_WALL, CellState.CLUE):
+            self.assertTrue(cell_state.is_weak_garden())
+        for cell_state in (CellState.WALL, CellState(0), CellState.WALL | CellState.EMPTY):
+            self.assertFalse(cell_state.is_weak_garden())
+
+    def test_cell_criteria_func_rejects_non_member_cell_states(self) -> None:
+        """Zero or combined CellState values are not single cell states, so they are never part of a weak garden."""
+        cell_criteria_func = WeakGarden.get_cell_criteria_func()
+        for cell_state in (CellState(0), CellState.WALL | CellState.EMPTY):
+            cell = MagicMock(name='Cell', cell_state=cell_state)
+            self.assertFalse(cell_criteria_func(cell))